@@ -16,9 +16,10 @@ app.autodiscover_tasks()
 
 # Celery beat schedule for periodic tasks
 app.conf.beat_schedule = {
-    'scrape-jobs-every-hour': {
-        'task': 'jobs.tasks.scrape_all_jobs',
-        'schedule': 3600.0,  # Run every hour
+    # Each active job board is scraped by its own PeriodicTask, at an interval set from its history
+    'update-scrape-schedules': {
+        'task': 'jobs.tasks.update_scrape_schedules',
+        'schedule': 900.0,  # Run every 15 minutes
     },
     'send-job-alerts': {
         'task': 'jobs.tasks.send_job_alerts',
@@ -133,6 +133,11 @@ CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
 
+# Per-board task leases, kept in the broker's Redis unless configured otherwise; an empty URL keeps
+# them in process, which only guards a single worker process
+TASK_LOCK_REDIS_URL = config('TASK_LOCK_REDIS_URL', default=CELERY_BROKER_URL)
+TASK_LOCK_TTL = config('TASK_LOCK_TTL', default=600, cast=int)  # seconds a lease lives without renewal
+
 # Email Configuration
 EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
 EMAIL_HOST = config('EMAIL_HOST', default='localhost')
@@ -144,6 +149,30 @@ DEFAULT_FROM_EMAIL = config('DEFAULT_FROM_EMAIL', default='noreply@jobaggregator
 
 # Scraper Service Configuration
 SCRAPER_SERVICE_URL = config('SCRAPER_SERVICE_URL', default='http://localhost:8001')
+SCRAPER_TIMEOUT = config('SCRAPER_TIMEOUT', default=300, cast=int)  # seconds before a submitted scrape is given up on
+# Deadline sent with each scrape, below SCRAPER_TIMEOUT so the service ends it as 'timeout' with partial results first
+SCRAPER_RUN_TIMEOUT = config('SCRAPER_RUN_TIMEOUT', default=240, cast=int)  # seconds
+SCRAPER_POLL_INTERVAL = config('SCRAPER_POLL_INTERVAL', default=5, cast=int)  # seconds
+SCRAPER_RESULTS_PAGE_SIZE = config('SCRAPER_RESULTS_PAGE_SIZE', default=1000, cast=int)
+SCRAPER_POOL_SIZE = config('SCRAPER_POOL_SIZE', default=10, cast=int)  # keep-alive connections per worker process
+INGEST_BATCH_SIZE = config('INGEST_BATCH_SIZE', default=1000, cast=int)
+DEDUPE_SIMHASH_DISTANCE = config('DEDUPE_SIMHASH_DISTANCE', default=6, cast=int)  # max differing bits, at most 7
+
+# Adaptive Scrape Scheduling
+SCRAPE_INTERVAL_DEFAULT = config('SCRAPE_INTERVAL_DEFAULT', default=3600, cast=int)  # seconds, until a board has history
+SCRAPE_INTERVAL_MIN = config('SCRAPE_INTERVAL_MIN', default=900, cast=int)  # seconds
+SCRAPE_INTERVAL_MAX = config('SCRAPE_INTERVAL_MAX', default=86400, cast=int)  # seconds
+SCRAPE_TARGET_NEW_JOBS = config('SCRAPE_TARGET_NEW_JOBS', default=50, cast=int)  # new jobs wanted per scrape
+SCRAPE_SCHEDULE_HISTORY = config('SCRAPE_SCHEDULE_HISTORY', default=10, cast=int)  # scrape logs per board considered
+
+# Job Matching Configuration
+MATCH_BULK_BATCH_SIZE = config('MATCH_BULK_BATCH_SIZE', default=1000, cast=int)
+MATCH_SCORING_MODE = config('MATCH_SCORING_MODE', default='index')  # 'index' or 'batch'
+MATCH_SCORING_BATCH_SIZE = config('MATCH_SCORING_BATCH_SIZE', default=500, cast=int)
+MATCH_SHARD_SIZE = config('MATCH_SHARD_SIZE', default=2000, cast=int)  # new jobs per matching shard
+JOB_TEXT_STEMMING = config('JOB_TEXT_STEMMING', default=False, cast=bool)
+PREFERENCE_MATCH_DEBOUNCE = config('PREFERENCE_MATCH_DEBOUNCE', default=30, cast=int)  # seconds
+PREFERENCE_MATCH_CHUNK_SIZE = config('PREFERENCE_MATCH_CHUNK_SIZE', default=2000, cast=int)
 
 # Logging Configuration
 LOGGING = {
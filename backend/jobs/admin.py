@@ -25,7 +25,7 @@ class JobMatchAdmin(admin.ModelAdmin):
 
 @admin.register(ScrapeLog)
 class ScrapeLogAdmin(admin.ModelAdmin):
-    list_display = ['job_board', 'status', 'jobs_scraped', 'jobs_created', 'jobs_updated', 'started_at', 'completed_at']
+    list_display = ['job_board', 'status', 'jobs_scraped', 'jobs_created', 'jobs_updated', 'jobs_unchanged', 'jobs_duplicates', 'matches_created', 'matches_skipped', 'started_at', 'completed_at']
     list_filter = ['status', 'job_board', 'started_at']
     search_fields = ['job_board__name']
     ordering = ['-started_at']
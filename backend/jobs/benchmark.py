@@ -0,0 +1,230 @@
+"""Synthetic datasets and timing helpers for the matching hot path
+
+Used by the ``benchmark_matching`` management command. Everything runs
+inside a transaction that is rolled back, so it can be pointed at a local
+SQLite database without leaving data behind.
+"""
+import itertools
+import random
+import time
+import tracemalloc
+
+from celery import current_app
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from users.models import JobPreference
+
+from .matching import KeywordIndex
+from .models import Job, JobBoard, JobMatch
+from .tasks import calculate_match_score, calculate_match_scores, match_new_jobs
+
+TECH_TERMS = [
+    'python', 'django', 'fastapi', 'celery', 'postgres', 'redis', 'react', 'typescript',
+    'javascript', 'node.js', 'go', 'rust', 'java', 'kotlin', 'swift', 'c++', 'c#', 'aws',
+    'gcp', 'azure', 'docker', 'kubernetes', 'terraform', 'graphql', 'machine learning',
+    'data engineering', 'spark', 'airflow', 'pandas', 'sql', 'devops', 'security',
+    'frontend', 'backend', 'full stack', 'mobile', 'ios', 'android', 'qa', 'sre',
+]
+TITLE_TERMS = ['senior', 'junior', 'lead', 'staff', 'principal', 'engineer', 'developer', 'manager', 'architect']
+FILLER_WORDS = [
+    'we', 'are', 'looking', 'for', 'a', 'team', 'to', 'build', 'and', 'ship', 'product',
+    'customers', 'with', 'experience', 'in', 'our', 'remote', 'company', 'great', 'benefits',
+    'growth', 'collaborate', 'design', 'systems', 'scale', 'ownership', 'impact', 'you', 'will',
+]
+LOCATION_TYPES = ['remote', 'onsite', 'hybrid']
+JOB_TYPES = ['full-time', 'part-time', 'contract']
+
+
+class RollbackBenchmark(Exception):
+    """Raised to roll back the synthetic data once a benchmark run is finished"""
+
+
+def make_description(rng, word_count):
+    words = []
+    while len(words) < word_count:
+        if rng.random() < 0.08:
+            words.append(rng.choice(TECH_TERMS))
+        else:
+            words.append(rng.choice(FILLER_WORDS))
+    return '<p>' + ' '.join(words) + '</p>'
+
+
+def create_jobs(rng, job_board, count, description_words, batch_size=1000):
+    now = timezone.now()
+    jobs = []
+    for i in range(count):
+        job = Job(
+            job_board=job_board,
+            title=f"{rng.choice(TITLE_TERMS).title()} {rng.choice(TECH_TERMS).title()} {rng.choice(TITLE_TERMS).title()}",
+            company=f"Company {rng.randrange(count // 10 + 1)}",
+            location='Remote',
+            location_type=rng.choice(LOCATION_TYPES),
+            job_type=rng.choice(JOB_TYPES),
+            description=make_description(rng, description_words),
+            external_id=f"bench_{i}",
+            external_url=f"https://example.com/jobs/{i}",
+            posted_date=now,
+        )
+        # bulk_create skips Job.save(), so normalize here like the ingest path does
+        job.refresh_normalized_text()
+        jobs.append(job)
+    Job.objects.bulk_create(jobs, batch_size=batch_size)
+    return list(Job.objects.filter(job_board=job_board).order_by('id'))
+
+
+def create_preferences(rng, count, min_keywords, max_keywords, batch_size=1000):
+    User = get_user_model()
+    User.objects.bulk_create(
+        [User(username=f"bench_user_{i}", email=f"bench_user_{i}@example.com") for i in range(count)],
+        batch_size=batch_size,
+    )
+    users = list(User.objects.filter(username__startswith='bench_user_').order_by('id'))
+
+    preferences = [
+        JobPreference(
+            user=user,
+            keywords=', '.join(rng.sample(TECH_TERMS, rng.randint(min_keywords, max_keywords))),
+            location_type=rng.choice(LOCATION_TYPES),
+            job_type=rng.choice(JOB_TYPES),
+        )
+        for user in users
+    ]
+    JobPreference.objects.bulk_create(preferences, batch_size=batch_size)
+    return list(JobPreference.objects.filter(user__in=users).select_related('user'))
+
+
+def measure(func, trace_memory=True):
+    """Run func and return (result, seconds, peak traced memory in bytes, query count)
+
+    tracemalloc slows pure-Python code down noticeably, so pass
+    trace_memory=False for clean throughput numbers (peak memory is then None).
+    """
+    peak = None
+    if trace_memory:
+        tracemalloc.start()
+    try:
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            result = func()
+            elapsed = time.perf_counter() - started
+        if trace_memory:
+            _, peak = tracemalloc.get_traced_memory()
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+    return result, elapsed, peak, len(queries)
+
+
+def benchmark_scalar_scoring(jobs, preferences, max_pairs, trace_memory=True):
+    """Time calculate_match_score over up to max_pairs (job, preference) pairs"""
+    # Pairs are generated lazily; the full product is far too large to build at 100k x 100k
+    def iter_pairs():
+        for preference in preferences:
+            keywords = preference.get_keywords_list()
+            for job in jobs:
+                yield job, preference, keywords
+
+    pairs = itertools.islice(iter_pairs(), max_pairs)
+
+    def run():
+        count = 0
+        for job, preference, keywords in pairs:
+            calculate_match_score(job, preference, keywords)
+            count += 1
+        return count
+
+    pair_count, elapsed, peak, query_count = measure(run, trace_memory)
+    return {
+        'pairs': pair_count,
+        'seconds': elapsed,
+        'pairs_per_second': pair_count / elapsed if elapsed else None,
+        'peak_memory_bytes': peak,
+        'queries': query_count,
+    }
+
+
+def benchmark_batch_scoring(jobs, preferences, trace_memory=True):
+    """Time calculate_match_scores over every job x preference pair
+
+    Jobs are scored in MATCH_SCORING_BATCH_SIZE batches, like the batch
+    scoring mode of match_new_jobs, so peak memory follows the batch size.
+    """
+    batch_size = settings.MATCH_SCORING_BATCH_SIZE
+
+    def run():
+        keyword_index = KeywordIndex(preferences)
+        candidate_pairs = 0
+        for start in range(0, len(jobs), batch_size):
+            candidate_pairs += calculate_match_scores(jobs[start:start + batch_size], keyword_index).nnz
+        return candidate_pairs
+
+    candidate_pairs, elapsed, peak, query_count = measure(run, trace_memory)
+    pairs = len(jobs) * len(preferences)
+    return {
+        'pairs': pairs,
+        'batch_size': batch_size,
+        'candidate_pairs': int(candidate_pairs),
+        'seconds': elapsed,
+        'pairs_per_second': pairs / elapsed if elapsed else None,
+        'peak_memory_bytes': peak,
+        'queries': query_count,
+    }
+
+
+def benchmark_match_new_jobs(job_board, jobs, preferences, trace_memory=True):
+    """Time a full match_new_jobs run, with Celery tasks executed in-process"""
+    conf = current_app.conf
+    previous_eager = conf.task_always_eager
+    conf.task_always_eager = True
+    try:
+        _, elapsed, peak, query_count = measure(lambda: match_new_jobs(job_board.id), trace_memory)
+    finally:
+        conf.task_always_eager = previous_eager
+
+    pairs = len(jobs) * len(preferences)
+    return {
+        'pairs': pairs,
+        'matches_created': JobMatch.objects.filter(job__job_board=job_board).count(),
+        'seconds': elapsed,
+        'pairs_per_second': pairs / elapsed if elapsed else None,
+        'peak_memory_bytes': peak,
+        'queries': query_count,
+    }
+
+
+def run_benchmark(job_count, preference_count, description_words=300, min_keywords=1,
+                  max_keywords=10, max_scalar_pairs=200000, seed=0, trace_memory=True):
+    """Generate one synthetic dataset, benchmark it and roll it back"""
+    rng = random.Random(seed)
+    results = {
+        'jobs': job_count,
+        'preferences': preference_count,
+        'description_words': description_words,
+        'keywords_per_preference': [min_keywords, max_keywords],
+        'seed': seed,
+    }
+
+    try:
+        with transaction.atomic():
+            job_board = JobBoard.objects.create(name=f"benchmark-{seed}", base_url='https://example.com')
+
+            started = time.perf_counter()
+            jobs = create_jobs(rng, job_board, job_count, description_words)
+            preferences = create_preferences(rng, preference_count, min_keywords, max_keywords)
+            results['setup_seconds'] = time.perf_counter() - started
+
+            results['calculate_match_score'] = benchmark_scalar_scoring(
+                jobs, preferences, max_scalar_pairs, trace_memory
+            )
+            results['calculate_match_scores'] = benchmark_batch_scoring(jobs, preferences, trace_memory)
+            results['match_new_jobs'] = benchmark_match_new_jobs(job_board, jobs, preferences, trace_memory)
+
+            raise RollbackBenchmark
+    except RollbackBenchmark:
+        pass
+
+    return results
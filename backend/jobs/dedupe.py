@@ -0,0 +1,184 @@
+"""Cross-source near-duplicate detection for ingested jobs
+
+Every job gets a dedupe key, a hash of its normalized (company, title,
+location), and a 64-bit SimHash of its normalized description. Both are
+indexed as LSH buckets in JobLSHBucket:
+
+- one bucket for the dedupe key, which finds same company, title and location
+- one bucket per 8-bit band of the SimHash, scoped to the company. Any two
+  SimHashes within 7 bits of each other share at least one band, so every
+  DEDUPE_SIMHASH_DISTANCE up to 7 is found.
+
+A job that shares a bucket with an older canonical job from another board
+is linked to it if their descriptions are within the SimHash distance and
+they have the same dedupe key or titles that share most of their words
+(templated descriptions make different roles at one company look alike).
+A matching key alone is not enough, since one company often has several
+openings with the same title and location, and jobs without a description
+are never linked. Matching and alerting skip linked duplicates.
+"""
+import hashlib
+from collections import Counter, defaultdict
+from functools import lru_cache
+
+import numpy as np
+from django.conf import settings
+
+from .models import Job, JobLSHBucket
+from .text import normalize_text
+
+SIMHASH_BANDS = 8
+BAND_BITS = 8
+MIN_TITLE_OVERLAP = 0.5
+_UINT64_MASK = (1 << 64) - 1
+
+
+def _to_signed(value):
+    """Fit an unsigned 64-bit value into a BigIntegerField"""
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def _hash64(text):
+    return int.from_bytes(hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+@lru_cache(maxsize=65536)
+def _token_hash(token):
+    return _hash64(token)
+
+
+def simhash(normalized_text):
+    """64-bit SimHash of already-normalized text, weighted by token counts; None when empty"""
+    counts = Counter(normalized_text.split())
+    if not counts:
+        return None
+
+    hashes = np.array([_token_hash(token) for token in counts], dtype='<u8')
+    weights = np.fromiter(counts.values(), dtype=np.int64, count=len(counts))
+    bits = np.unpackbits(hashes.view(np.uint8).reshape(-1, 8), axis=1, bitorder='little')
+    votes = weights @ (2 * bits.astype(np.int64) - 1)
+    value = int(np.packbits(votes > 0, bitorder='little').view('<u8')[0])
+    return _to_signed(value)
+
+
+def hamming_distance(a, b):
+    return bin((a ^ b) & _UINT64_MASK).count('1')
+
+
+def company_key(job):
+    return normalize_text(job.company)
+
+
+def dedupe_key(job):
+    fields = (company_key(job), job.normalized_title or normalize_text(job.title), normalize_text(job.location))
+    return hashlib.sha256('\0'.join(fields).encode('utf-8')).hexdigest()
+
+
+def fingerprint_job(job):
+    """Set dedupe_key and simhash; call after refresh_normalized_text()"""
+    job.dedupe_key = dedupe_key(job)
+    job.simhash = simhash(job.normalized_description)
+
+
+def lsh_buckets(job):
+    """Bucket ids for a fingerprinted job"""
+    buckets = [_to_signed(_hash64(f"key:{job.dedupe_key}"))]
+    if job.simhash is not None:
+        company = company_key(job)
+        value = job.simhash & _UINT64_MASK
+        for band in range(SIMHASH_BANDS):
+            band_value = (value >> (band * BAND_BITS)) & ((1 << BAND_BITS) - 1)
+            buckets.append(_to_signed(_hash64(f"band:{company}:{band}:{band_value}")))
+    return buckets
+
+
+def title_overlap(a, b):
+    """Jaccard similarity of two normalized titles' words"""
+    a, b = set(a.split()), set(b.split())
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def is_duplicate(job, candidate, max_distance):
+    """Whether job is a cross-source copy of candidate, a canonical job"""
+    if job.job_board_id == candidate['job_board_id']:
+        return False
+    if job.simhash is None or candidate['simhash'] is None:
+        return False
+    if hamming_distance(job.simhash, candidate['simhash']) > max_distance:
+        return False
+    return (
+        job.dedupe_key == candidate['dedupe_key']
+        or title_overlap(job.normalized_title, candidate['normalized_title']) >= MIN_TITLE_OVERLAP
+    )
+
+
+def link_duplicates(jobs, max_distance=None):
+    """Index fingerprinted, saved jobs and link each one to its canonical copy
+
+    Jobs are processed in id order, so the canonical copy is always the oldest
+    job of a cluster. Returns the number of jobs linked as duplicates.
+    """
+    if max_distance is None:
+        max_distance = settings.DEDUPE_SIMHASH_DISTANCE
+
+    jobs = sorted(jobs, key=lambda job: job.id)
+    job_ids = [job.id for job in jobs]
+    buckets_by_job = {job.id: lsh_buckets(job) for job in jobs}
+
+    # Re-ingested jobs are re-indexed from scratch
+    JobLSHBucket.objects.filter(job_id__in=job_ids).delete()
+
+    all_buckets = {bucket for buckets in buckets_by_job.values() for bucket in buckets}
+    bucket_members = defaultdict(set)
+    for job_id, bucket in JobLSHBucket.objects.filter(bucket__in=all_buckets).values_list('job_id', 'bucket'):
+        bucket_members[bucket].add(job_id)
+
+    candidate_ids = {job_id for members in bucket_members.values() for job_id in members}
+    candidates = {
+        row['id']: row
+        for row in Job.objects.filter(id__in=candidate_ids).values(
+            'id', 'job_board_id', 'normalized_title', 'dedupe_key', 'simhash', 'canonical_job_id'
+        )
+    }
+
+    duplicates = 0
+    changed = []
+    new_buckets = []
+    for job in jobs:
+        matches = set()
+        for bucket in buckets_by_job[job.id]:
+            matches.update(candidate_id for candidate_id in bucket_members[bucket] if candidate_id < job.id)
+
+        # Only canonical jobs are candidates, so a job is never linked through
+        # another board's copy to a job on its own board
+        canonical_id = None
+        for candidate_id in sorted(matches):
+            candidate = candidates.get(candidate_id)
+            if candidate is None or candidate['canonical_job_id'] is not None:
+                continue
+            if is_duplicate(job, candidate, max_distance):
+                canonical_id = candidate_id
+                break
+
+        if canonical_id is not None:
+            duplicates += 1
+        if job.canonical_job_id != canonical_id:
+            job.canonical_job_id = canonical_id
+            changed.append(job)
+
+        # Later jobs in this batch can match this one
+        candidates[job.id] = {
+            'id': job.id, 'job_board_id': job.job_board_id, 'normalized_title': job.normalized_title,
+            'dedupe_key': job.dedupe_key,
+            'simhash': job.simhash, 'canonical_job_id': canonical_id,
+        }
+        for bucket in buckets_by_job[job.id]:
+            bucket_members[bucket].add(job.id)
+            new_buckets.append(JobLSHBucket(job_id=job.id, bucket=bucket))
+
+    JobLSHBucket.objects.bulk_create(new_buckets, batch_size=settings.INGEST_BATCH_SIZE)
+    if changed:
+        Job.objects.bulk_update(changed, ['canonical_job'], batch_size=settings.INGEST_BATCH_SIZE)
+    return duplicates
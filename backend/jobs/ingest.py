@@ -0,0 +1,159 @@
+"""Bulk upsert of scraped postings into Job
+
+Postings arrive as JobData dicts from the scraper service and are upserted
+on (job_board, external_id) in chunks, with one SELECT and one INSERT ... ON
+CONFLICT DO UPDATE per chunk instead of per-row ORM saves.
+"""
+import hashlib
+import json
+import logging
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .dedupe import fingerprint_job, link_duplicates
+from .models import Job
+
+logger = logging.getLogger(__name__)
+
+# JobData fields copied onto Job
+SOURCE_FIELDS = [
+    'title', 'company', 'location', 'location_type', 'job_type', 'description', 'requirements',
+    'salary_min', 'salary_max', 'currency', 'external_url', 'tags', 'posted_date',
+]
+# HTML scrapers stamp posted_date with the scrape time, so it is left out of the hash
+HASHED_FIELDS = [field for field in SOURCE_FIELDS if field != 'posted_date']
+UPDATE_FIELDS = SOURCE_FIELDS + [
+    'normalized_title', 'normalized_description', 'content_hash', 'source_hash', 'dedupe_key', 'simhash',
+    'scraped_at', 'is_active',
+]
+
+
+def source_hash(posting):
+    """Hash of the scraped fields of a posting, stable across key order and types"""
+    values = [posting.get(field) for field in HASHED_FIELDS]
+    payload = json.dumps(values, sort_keys=True, default=str, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def parse_posted_date(value):
+    if not value:
+        return timezone.now()
+    posted_date = parse_datetime(value) if isinstance(value, str) else value
+    if posted_date is None:
+        return timezone.now()
+    if timezone.is_naive(posted_date):
+        posted_date = timezone.make_aware(posted_date)
+    return posted_date
+
+
+def build_job(job_board, posting, digest):
+    job = Job(
+        job_board=job_board,
+        external_id=posting['external_id'],
+        title=posting.get('title') or '',
+        company=posting.get('company') or '',
+        location=posting.get('location') or '',
+        location_type=posting.get('location_type') or 'remote',
+        job_type=posting.get('job_type') or 'full-time',
+        description=posting.get('description') or '',
+        requirements=posting.get('requirements') or '',
+        salary_min=posting.get('salary_min'),
+        salary_max=posting.get('salary_max'),
+        currency=posting.get('currency') or 'USD',
+        external_url=posting.get('external_url') or '',
+        tags=posting.get('tags') or [],
+        posted_date=parse_posted_date(posting.get('posted_date')),
+        source_hash=digest,
+        is_active=True,
+    )
+    # bulk_create skips Job.save(), so normalize here
+    job.refresh_normalized_text()
+    fingerprint_job(job)
+    return job
+
+
+def ingest_chunk(job_board, postings):
+    """Upsert one chunk of postings; returns (created, updated, unchanged, duplicates, updated_job_ids)"""
+    # A posting repeated within the chunk would hit ON CONFLICT twice in one statement
+    by_external_id = {}
+    for posting in postings:
+        if posting.get('external_id'):
+            by_external_id[posting['external_id']] = posting
+
+    existing = {
+        external_id: (job_id, digest)
+        for external_id, job_id, digest in Job.objects.filter(
+            job_board=job_board, external_id__in=list(by_external_id)
+        ).values_list('external_id', 'id', 'source_hash')
+    }
+
+    jobs = []
+    updated_job_ids = []
+    created = updated = unchanged = 0
+    for external_id, posting in by_external_id.items():
+        digest = source_hash(posting)
+        if external_id not in existing:
+            created += 1
+        elif existing[external_id][1] != digest:
+            updated += 1
+            updated_job_ids.append(existing[external_id][0])
+        else:
+            unchanged += 1
+            continue
+        jobs.append(build_job(job_board, posting, digest))
+
+    duplicates = 0
+    if jobs:
+        Job.objects.bulk_create(
+            jobs,
+            update_conflicts=True,
+            unique_fields=['job_board', 'external_id'],
+            update_fields=UPDATE_FIELDS,
+        )
+        # Upserts don't return primary keys on every backend, so reload what dedupe needs
+        saved = Job.objects.filter(
+            job_board=job_board, external_id__in=[job.external_id for job in jobs]
+        ).only(
+            'id', 'job_board_id', 'company', 'location', 'normalized_title', 'dedupe_key', 'simhash', 'canonical_job_id'
+        )
+        duplicates = link_duplicates(list(saved))
+    return created, updated, unchanged, duplicates, updated_job_ids
+
+
+def ingest_jobs(job_board, postings, batch_size=None):
+    """Upsert scraped postings (JobData dicts) into Job for a job board
+
+    Postings whose scraped fields hash to the stored source_hash are skipped;
+    the rest are linked to their canonical copy if they duplicate an older job.
+    Returns a dict with created, updated, unchanged and duplicates counts, and
+    updated_job_ids: the ids of the updated jobs, which keep the id they were
+    first matched under and so need matching again.
+    """
+    batch_size = batch_size or settings.INGEST_BATCH_SIZE
+    counts = {'created': 0, 'updated': 0, 'unchanged': 0, 'duplicates': 0, 'updated_job_ids': []}
+
+    chunk = []
+    for posting in postings:
+        chunk.append(posting)
+        if len(chunk) >= batch_size:
+            _add_counts(counts, ingest_chunk(job_board, chunk))
+            chunk = []
+    if chunk:
+        _add_counts(counts, ingest_chunk(job_board, chunk))
+
+    logger.info(
+        f"Ingested jobs for {job_board.name}: {counts['created']} created, "
+        f"{counts['updated']} updated, {counts['unchanged']} unchanged, {counts['duplicates']} duplicates"
+    )
+    return counts
+
+
+def _add_counts(counts, chunk_counts):
+    created, updated, unchanged, duplicates, updated_job_ids = chunk_counts
+    counts['created'] += created
+    counts['updated'] += updated
+    counts['unchanged'] += unchanged
+    counts['duplicates'] += duplicates
+    counts['updated_job_ids'].extend(updated_job_ids)
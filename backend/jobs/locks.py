@@ -0,0 +1,246 @@
+"""Lease locks per (task, job board) in the Redis broker
+
+A lease is a Redis key holding its holder's token with a TTL. The holder
+renews it as it makes progress and releases it when done, and a holder that
+dies just lets it expire. Scrapes and match runs span several Celery tasks,
+so the token is passed along from the task that acquired the lease.
+
+With coalesce=True a request refused while a run holds the lease leaves a
+pending marker with its task arguments. However many requests arrive, the
+holder queues a single follow-up run with the latest arguments on release.
+
+Counts of acquired, skipped and coalesced requests, lost leases, and how
+long coalesced requests waited for their follow-up run are kept per task.
+
+Without TASK_LOCK_REDIS_URL, or while Celery runs tasks eagerly (as in
+benchmark_matching), leases are kept in process instead, since every task
+then runs in the process that takes the lease.
+"""
+import json
+import logging
+import time
+import uuid
+
+import redis
+from celery import current_app
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+METRICS_KEY = 'task-locks:metrics'
+
+_RELEASE = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+_RENEW = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('pexpire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+_client = None
+
+
+def get_client():
+    """Redis client for leases; redis-py replaces its connections after a fork"""
+    global _client
+    if _client is None:
+        _client = redis.Redis.from_url(settings.TASK_LOCK_REDIS_URL, decode_responses=True)
+    return _client
+
+
+def use_local_leases():
+    """Whether leases are kept in process: no TASK_LOCK_REDIS_URL, or tasks run eagerly"""
+    return not settings.TASK_LOCK_REDIS_URL or current_app.conf.task_always_eager
+
+
+class RedisLeaseStore:
+    """Leases, pending markers and metrics in Redis, shared by every worker"""
+
+    def __init__(self, client=None):
+        self.client = client or get_client()
+        self._renew = self.client.register_script(_RENEW)
+        self._release = self.client.register_script(_RELEASE)
+
+    def take(self, key, token, ttl_ms):
+        return bool(self.client.set(key, token, nx=True, px=ttl_ms))
+
+    def renew(self, key, token, ttl_ms):
+        return bool(self._renew(keys=[key], args=[token, ttl_ms]))
+
+    def release(self, key, token):
+        self._release(keys=[key], args=[token])
+
+    def add_pending(self, pending_key, args, ttl_ms):
+        """Record a coalesced request's args; returns True if none was pending yet"""
+        pipe = self.client.pipeline()
+        pipe.hsetnx(pending_key, 'queued_at', time.time())
+        pipe.hset(pending_key, 'args', json.dumps(args))
+        pipe.pexpire(pending_key, ttl_ms)
+        first, _, _ = pipe.execute()
+        return bool(first)
+
+    def pending_args(self, pending_key):
+        args = self.client.hget(pending_key, 'args')
+        return json.loads(args) if args is not None else None
+
+    def take_pending(self, pending_key):
+        """Clear the pending marker; returns when it was queued, or None"""
+        pipe = self.client.pipeline()
+        pipe.hget(pending_key, 'queued_at')
+        pipe.delete(pending_key)
+        queued_at, _ = pipe.execute()
+        return float(queued_at) if queued_at is not None else None
+
+    def count(self, field, amount):
+        if isinstance(amount, float):
+            self.client.hincrbyfloat(METRICS_KEY, field, amount)
+        else:
+            self.client.hincrby(METRICS_KEY, field, amount)
+
+    def metrics(self):
+        return self.client.hgetall(METRICS_KEY)
+
+
+class LocalLeaseStore:
+    """Leases, pending markers and metrics in process memory"""
+
+    def __init__(self):
+        self.leases = {}  # key -> (token, expires_at)
+        self.pending = {}  # pending key -> (queued_at, args, expires_at)
+        self.counts = {}
+
+    def take(self, key, token, ttl_ms):
+        held = self.leases.get(key)
+        if held is not None and held[1] > time.monotonic():
+            return False
+        self.leases[key] = (token, time.monotonic() + ttl_ms / 1000)
+        return True
+
+    def renew(self, key, token, ttl_ms):
+        held = self.leases.get(key)
+        if held is None or held[0] != token or held[1] <= time.monotonic():
+            return False
+        self.leases[key] = (token, time.monotonic() + ttl_ms / 1000)
+        return True
+
+    def release(self, key, token):
+        held = self.leases.get(key)
+        if held is not None and held[0] == token:
+            del self.leases[key]
+
+    def add_pending(self, pending_key, args, ttl_ms):
+        current = self._live_pending(pending_key)
+        queued_at = current[0] if current else time.time()
+        self.pending[pending_key] = (queued_at, args, time.monotonic() + ttl_ms / 1000)
+        return current is None
+
+    def pending_args(self, pending_key):
+        current = self._live_pending(pending_key)
+        return current[1] if current else None
+
+    def take_pending(self, pending_key):
+        current = self._live_pending(pending_key)
+        self.pending.pop(pending_key, None)
+        return current[0] if current else None
+
+    def _live_pending(self, pending_key):
+        current = self.pending.get(pending_key)
+        if current is not None and current[2] <= time.monotonic():
+            return None
+        return current
+
+    def count(self, field, amount):
+        self.counts[field] = self.counts.get(field, 0) + amount
+
+    def metrics(self):
+        return self.counts
+
+
+local_store = LocalLeaseStore()
+
+
+def get_store(client=None):
+    """Lease store for this process: Redis, unless there is none or tasks run eagerly"""
+    if client is None and use_local_leases():
+        return local_store
+    return RedisLeaseStore(client)
+
+
+class TaskLease:
+    """Lease on one (task, job board) pair"""
+
+    def __init__(self, task_name, job_board_id, ttl=None, client=None):
+        self.task_name = task_name
+        self.key = f"task-lock:{task_name}:{job_board_id}"
+        self.pending_key = f"{self.key}:pending"
+        self.ttl_ms = int((ttl or settings.TASK_LOCK_TTL) * 1000)
+        self.store = get_store(client)
+
+    def acquire(self, coalesce=False, args=None):
+        """Take the lease; returns its token, or None if another run holds it
+
+        A refused request with coalesce=True records `args` for a follow-up run.
+        """
+        token = uuid.uuid4().hex
+        if self.store.take(self.key, token, self.ttl_ms):
+            self._count('acquired')
+            self._take_pending()
+            return token
+
+        self._count('skipped')
+        if coalesce:
+            # Outlives the lease, in case its holder dies before queuing the follow-up
+            if self.store.add_pending(self.pending_key, args or [], 2 * self.ttl_ms):
+                self._count('coalesced')
+        return None
+
+    def renew(self, token):
+        """Extend the lease by its TTL; returns False if it expired and was lost"""
+        if self.store.renew(self.key, token, self.ttl_ms):
+            return True
+        self._count('lost')
+        logger.warning(f"Lost lease {self.key}; another run may be in progress")
+        return False
+
+    def release(self, token, follow_up=None):
+        """Release the lease and queue `follow_up` (a Celery task) if a request was coalesced
+
+        Callers release from their error handlers too, so a Redis error is only
+        logged; the lease then expires after its TTL.
+        """
+        try:
+            self.store.release(self.key, token)
+
+            if follow_up is None:
+                return
+            args = self.store.pending_args(self.pending_key)
+        except redis.RedisError as e:
+            logger.error(f"Error releasing lease {self.key}: {str(e)}")
+            return
+        if args is not None:
+            follow_up.apply_async(args=args)
+
+    def _take_pending(self):
+        """Clear the pending marker served by the run that just took the lease"""
+        queued_at = self.store.take_pending(self.pending_key)
+        if queued_at is not None:
+            self._count('waits')
+            self._count('wait_seconds', time.time() - queued_at)
+
+    def _count(self, metric, amount=1):
+        self.store.count(f"{self.task_name}:{metric}", amount)
+
+
+def lock_metrics(client=None):
+    """Lease metrics as {task_name: {metric: value}}"""
+    metrics = {}
+    for field, value in get_store(client).metrics().items():
+        task_name, metric = field.rsplit(':', 1)
+        metrics.setdefault(task_name, {})[metric] = float(value) if metric == 'wait_seconds' else int(value)
+    return metrics
@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand
+
+from jobs.models import Job
+
+
+class Command(BaseCommand):
+    help = (
+        'Fill normalized_title and normalized_description for jobs saved before those fields existed. '
+        'With --all, recompute them for every job, e.g. after a change to the tokenizer in jobs.text.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--all', action='store_true',
+                            help='Recompute every job, not only those that were never normalized')
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        jobs = Job.objects.all() if options['all'] else Job.objects.filter(content_hash='')
+        jobs = jobs.only(
+            'id', 'title', 'description', 'normalized_title', 'normalized_description', 'content_hash'
+        ).order_by('id')
+
+        fields = ['normalized_title', 'normalized_description', 'content_hash']
+        pending = []
+        updated = 0
+        for job in jobs.iterator(chunk_size=batch_size):
+            if job.refresh_normalized_text(force=options['all']):
+                pending.append(job)
+            if len(pending) >= batch_size:
+                Job.objects.bulk_update(pending, fields)
+                updated += len(pending)
+                pending = []
+
+        if pending:
+            Job.objects.bulk_update(pending, fields)
+            updated += len(pending)
+
+        self.stdout.write(self.style.SUCCESS(f"Normalized {updated} jobs"))
@@ -0,0 +1,85 @@
+import itertools
+import json
+import platform
+import subprocess
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.utils import timezone
+
+from jobs.benchmark import run_benchmark
+
+
+class Command(BaseCommand):
+    help = (
+        'Benchmark calculate_match_score, calculate_match_scores and match_new_jobs on synthetic '
+        'jobs and preferences, and save the results as JSON. Intended for a local SQLite database: '
+        'DATABASE_URL=sqlite:///benchmark.sqlite3 python manage.py migrate && '
+        'DATABASE_URL=sqlite:///benchmark.sqlite3 python manage.py benchmark_matching'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--jobs', type=int, nargs='+', default=[1000],
+                            help='Number of synthetic jobs; several values run every combination')
+        parser.add_argument('--preferences', type=int, nargs='+', default=[1000],
+                            help='Number of synthetic preferences (one user each)')
+        parser.add_argument('--description-words', type=int, default=300,
+                            help='Words per job description')
+        parser.add_argument('--min-keywords', type=int, default=1)
+        parser.add_argument('--max-keywords', type=int, default=10)
+        parser.add_argument('--max-scalar-pairs', type=int, default=200000,
+                            help='Cap on pairs timed one at a time with calculate_match_score')
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--no-memory', action='store_true',
+                            help='Skip tracemalloc, which slows Python code down, for clean throughput numbers')
+        parser.add_argument('--output', default='benchmark_matching.json',
+                            help='File the JSON results are written to')
+
+    def handle(self, *args, **options):
+        runs = []
+        for job_count, preference_count in itertools.product(options['jobs'], options['preferences']):
+            self.stdout.write(f"Benchmarking {job_count} jobs x {preference_count} preferences...")
+
+            result = run_benchmark(
+                job_count,
+                preference_count,
+                description_words=options['description_words'],
+                min_keywords=options['min_keywords'],
+                max_keywords=options['max_keywords'],
+                max_scalar_pairs=options['max_scalar_pairs'],
+                seed=options['seed'],
+                trace_memory=not options['no_memory'],
+            )
+            runs.append(result)
+
+            for name in ('calculate_match_score', 'calculate_match_scores', 'match_new_jobs'):
+                stats = result[name]
+                peak = stats['peak_memory_bytes']
+                peak = f"{peak / 1024 / 1024:.1f} MiB" if peak is not None else 'n/a'
+                self.stdout.write(
+                    f"  {name}: {stats['pairs_per_second']:,.0f} pairs/sec, "
+                    f"peak {peak}, {stats['queries']} queries"
+                )
+
+        report = {
+            'commit': self._git_commit(),
+            'created_at': timezone.now().isoformat(),
+            'python': platform.python_version(),
+            'database': connection.vendor,
+            'scoring_mode': settings.MATCH_SCORING_MODE,
+            'runs': runs,
+        }
+
+        with open(options['output'], 'w') as f:
+            json.dump(report, f, indent=2)
+
+        self.stdout.write(self.style.SUCCESS(f"Results written to {options['output']}"))
+
+    def _git_commit(self):
+        try:
+            return subprocess.check_output(
+                ['git', 'rev-parse', 'HEAD'], cwd=settings.BASE_DIR, stderr=subprocess.DEVNULL, text=True
+            ).strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
@@ -0,0 +1,49 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+
+from jobs.models import EmailNotification, JobMatch
+
+
+class Command(BaseCommand):
+    help = (
+        'Merge duplicate JobMatch rows for the same user and job, so that the unique_job_match_per_user '
+        'constraint can be applied. Run it before migrating to a schema that adds the constraint.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true',
+                            help='Only report how many duplicate rows would be removed')
+
+    def handle(self, *args, **options):
+        duplicate_pairs = (
+            JobMatch.objects.values('user_id', 'job_id')
+            .annotate(count=Count('id'))
+            .filter(count__gt=1)
+            .order_by()
+        )
+
+        removed = 0
+        with transaction.atomic():
+            for pair in duplicate_pairs.iterator():
+                matches = list(
+                    JobMatch.objects.filter(user_id=pair['user_id'], job_id=pair['job_id']).order_by('id')
+                )
+                keep, extras = matches[0], matches[1:]
+                removed += len(extras)
+                if options['dry_run']:
+                    continue
+
+                # The oldest row is kept with the best score and every flag the user set on any copy
+                keep.match_score = max(match.match_score for match in matches)
+                keep.is_viewed = any(match.is_viewed for match in matches)
+                keep.is_bookmarked = any(match.is_bookmarked for match in matches)
+                keep.is_applied = any(match.is_applied for match in matches)
+                keep.save(update_fields=['match_score', 'is_viewed', 'is_bookmarked', 'is_applied'])
+
+                for notification in EmailNotification.objects.filter(job_matches__in=extras).distinct():
+                    notification.job_matches.add(keep)
+                JobMatch.objects.filter(id__in=[match.id for match in extras]).delete()
+
+        verb = 'Would remove' if options['dry_run'] else 'Removed'
+        self.stdout.write(self.style.SUCCESS(f"{verb} {removed} duplicate job matches"))
@@ -0,0 +1,223 @@
+from collections import defaultdict
+from functools import lru_cache
+
+import ahocorasick
+
+from django.db.models import Q
+
+from .models import Job, JobMatch
+from .text import job_search_fields, normalize_keyword
+
+
+class KeywordIndex:
+    """Inverted index of normalized keyword -> preference ids.
+
+    Built once per matching run so each job is only scored against the
+    preferences whose keywords actually appear in its title or description.
+    Job text is scanned once per field with a multi-pattern automaton built
+    from the union of all indexed keywords.
+    """
+
+    def __init__(self, preferences):
+        self.preferences = {}
+        self.keywords = {}
+        self.order = {}
+        self.index = defaultdict(set)
+
+        for position, preference in enumerate(preferences):
+            keywords = preference.get_keywords_list()
+            if not keywords:
+                continue
+
+            self.preferences[preference.id] = preference
+            self.keywords[preference.id] = keywords
+            self.order[preference.id] = position
+
+            for keyword in keywords:
+                keyword = normalize_keyword(keyword)
+                if keyword:
+                    self.index[keyword].add(preference.id)
+
+        self.automaton = build_keyword_automaton(frozenset(self.index))
+
+    def __len__(self):
+        return len(self.preferences)
+
+    def preference_list(self):
+        """Return (preference, keywords) pairs in index order"""
+        return [(preference, self.keywords[preference_id]) for preference_id, preference in self.preferences.items()]
+
+    def find_hits(self, text):
+        """Return the indexed keywords that occur in the given normalized text"""
+        if self.automaton is None:
+            return set()
+        return {keyword for _, keyword in self.automaton.iter(text)}
+
+    def scan(self, job):
+        """Return the (title, description) keyword hit sets for a job"""
+        title, description = job_search_fields(job)
+        return self.find_hits(title), self.find_hits(description)
+
+    def candidates(self, hits):
+        """Yield (preference, keywords) for preferences with at least one keyword in hits
+
+        Preferences without any keyword hit can only reach the threshold through
+        the location and job type weights (0.2 + 0.1), so they are not matches
+        on keywords and are skipped. Candidates are yielded in the order the
+        preferences were given to the index.
+        """
+        preference_ids = set()
+        for keyword in hits:
+            preference_ids |= self.index[keyword]
+
+        for preference_id in sorted(preference_ids, key=self.order.__getitem__):
+            yield self.preferences[preference_id], self.keywords[preference_id]
+
+
+@lru_cache(maxsize=4)
+def build_keyword_automaton(keywords):
+    """Compile an Aho-Corasick automaton for a frozenset of normalized keywords
+
+    Cached on the keyword set, so workers only rebuild it when the active
+    preferences introduce or drop a keyword.
+    """
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        if keyword:
+            automaton.add_word(keyword, keyword)
+
+    if not len(automaton):
+        return None
+
+    automaton.make_automaton()
+    return automaton
+
+
+def preference_candidate_jobs(preference, keywords):
+    """Return the active jobs that can clear the matching threshold for a preference
+
+    A job needs at least one keyword hit. When neither location_type nor
+    job_type matches, description hits alone top out at 0.3, so it also needs
+    a keyword in the title.
+
+    Keyword hits are case-sensitive `contains` lookups on the normalized
+    columns, i.e. LIKE '%keyword%'. On PostgreSQL the pg_trgm GIN indexes on
+    Job serve them for keywords of three or more characters; shorter keywords
+    such as "go" or "qa", and other databases, scan the active jobs.
+    """
+    title_q = Q()
+    keyword_q = Q()
+    for keyword in filter(None, map(normalize_keyword, keywords)):
+        title_q |= Q(normalized_title__contains=keyword)
+        keyword_q |= Q(normalized_title__contains=keyword) | Q(normalized_description__contains=keyword)
+
+    return Job.objects.filter(is_active=True, canonical_job__isnull=True).filter(keyword_q).filter(
+        Q(location_type=preference.location_type) | Q(job_type=preference.job_type) | title_q
+    ).filter(preference_constraints_q(preference))
+
+
+def location_constraints_q(location_type, job_type, desired_location):
+    """Hard location_type / job_type / location constraints as a Q on Job
+
+    A blank job_type accepts any job type, and desired_location is ignored
+    for remote preferences.
+    """
+    q = Q(location_type=location_type)
+    if job_type:
+        q &= Q(job_type=job_type)
+    if desired_location and location_type != 'remote':
+        q &= Q(location__icontains=desired_location)
+    return q
+
+
+def salary_constraints_q(min_salary, max_salary):
+    """Salary range overlap as a Q on Job; jobs without a salary are kept"""
+    q = Q()
+    if min_salary:
+        q &= Q(salary_max__isnull=True) | Q(salary_max__gte=min_salary)
+    if max_salary:
+        q &= Q(salary_min__isnull=True) | Q(salary_min__lte=max_salary)
+    return q
+
+
+def preference_constraints_q(preference):
+    """All hard constraints of a preference as a Q on Job"""
+    return location_constraints_q(*location_constraint_key(preference)) & salary_constraints_q(
+        preference.min_salary, preference.max_salary
+    )
+
+
+def location_constraint_key(preference):
+    """Key of the location_constraints_q a preference needs; equal keys share one query"""
+    # Remote preferences ignore desired_location, so it must not split their key
+    desired_location = '' if preference.location_type == 'remote' else preference.desired_location
+    return (
+        preference.location_type,
+        preference.job_type or '',
+        (desired_location or '').strip().lower(),
+    )
+
+
+def salary_overlaps(job, preference):
+    """Python equivalent of salary_constraints_q for a single job"""
+    if preference.min_salary and job.salary_max is not None and job.salary_max < preference.min_salary:
+        return False
+    if preference.max_salary and job.salary_min is not None and job.salary_min > preference.max_salary:
+        return False
+    return True
+
+
+class ConstraintFilter:
+    """Resolves preference hard constraints against a window of jobs
+
+    Preferences sharing location_type, job_type and desired location share
+    one indexed query on Job, so a run issues one query per distinct
+    combination rather than one per preference. Salary overlap is checked on
+    the loaded job row.
+    """
+
+    def __init__(self, jobs, preferences):
+        self.allowed_job_ids = {}
+        for key in {location_constraint_key(preference) for preference in preferences}:
+            self.allowed_job_ids[key] = frozenset(
+                jobs.filter(location_constraints_q(*key)).values_list('id', flat=True)
+            )
+
+    def allows(self, job, preference):
+        return (
+            job.id in self.allowed_job_ids[location_constraint_key(preference)]
+            and salary_overlaps(job, preference)
+        )
+
+
+def load_matched_pairs(jobs, user_ids=None):
+    """Return the (user_id, job_id) pairs that already have a JobMatch for the given jobs"""
+    matches = JobMatch.objects.filter(job__in=jobs)
+    if user_ids is not None:
+        matches = matches.filter(user_id__in=user_ids)
+    return set(matches.values_list('user_id', 'job_id'))
+
+
+class MatchWriter:
+    """Collects new JobMatch rows and writes them in bulk_create batches
+
+    Conflicting pairs are ignored by the database (JobMatch is unique per
+    user and job), so a concurrent run can never produce duplicates.
+    """
+
+    def __init__(self, batch_size=1000):
+        self.batch_size = batch_size
+        self.pending = []
+        self.written = 0
+
+    def add(self, match):
+        self.pending.append(match)
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self.pending:
+            return
+        JobMatch.objects.bulk_create(self.pending, batch_size=self.batch_size, ignore_conflicts=True)
+        self.written += len(self.pending)
+        self.pending = []
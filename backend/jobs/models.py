@@ -0,0 +1,172 @@
+from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.db import models
+
+from .text import content_hash, normalize_text
+
+
+class JobBoard(models.Model):
+    name = models.CharField(max_length=100, unique=True)
+    base_url = models.URLField()
+    scraper_config = models.JSONField(default=dict, blank=True)
+    is_active = models.BooleanField(default=True)
+    # Highest Job id already processed by match_new_jobs for this board
+    last_matched_job_id = models.BigIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.name
+
+
+class Job(models.Model):
+    LOCATION_TYPE_CHOICES = [
+        ('remote', 'Remote'),
+        ('onsite', 'On-site'),
+        ('hybrid', 'Hybrid'),
+    ]
+
+    title = models.CharField(max_length=255)
+    company = models.CharField(max_length=255)
+    location = models.CharField(max_length=255, blank=True)
+    location_type = models.CharField(max_length=20, choices=LOCATION_TYPE_CHOICES, default='remote')
+    job_type = models.CharField(max_length=50, default='full-time')
+    description = models.TextField(blank=True)
+    requirements = models.TextField(blank=True)
+    salary_min = models.IntegerField(null=True, blank=True)
+    salary_max = models.IntegerField(null=True, blank=True)
+    currency = models.CharField(max_length=10, default='USD')
+    external_id = models.CharField(max_length=255)
+    external_url = models.URLField(max_length=1000)
+    job_board = models.ForeignKey(JobBoard, on_delete=models.CASCADE, related_name='jobs')
+    tags = models.JSONField(default=list, blank=True)
+    posted_date = models.DateTimeField()
+    scraped_at = models.DateTimeField(auto_now=True)
+    is_active = models.BooleanField(default=True)
+
+    # Normalized at ingest time (HTML stripped, tokenized, lowercased) for matching and search
+    normalized_title = models.TextField(blank=True, editable=False)
+    normalized_description = models.TextField(blank=True, editable=False)
+    content_hash = models.CharField(max_length=64, blank=True, editable=False)
+    # Hash of every scraped field, so ingest can skip postings that have not changed
+    source_hash = models.CharField(max_length=64, blank=True, editable=False)
+
+    # Cross-source dedupe: the canonical copy of this posting, if this row is a duplicate
+    canonical_job = models.ForeignKey(
+        'self', on_delete=models.SET_NULL, null=True, blank=True, related_name='duplicates'
+    )
+    dedupe_key = models.CharField(max_length=64, blank=True, editable=False)
+    simhash = models.BigIntegerField(null=True, blank=True, editable=False)
+
+    class Meta:
+        ordering = ['-posted_date']
+        constraints = [
+            models.UniqueConstraint(fields=['job_board', 'external_id'], name='unique_job_per_board'),
+        ]
+        indexes = [
+            models.Index(fields=['is_active', 'location_type', 'job_type']),
+            models.Index(fields=['job_board', 'location_type', 'job_type']),
+            models.Index(fields=['salary_min', 'salary_max']),
+            # Trigram indexes for the substring keyword filters in jobs.matching and search (PostgreSQL
+            # with pg_trgm; other databases get a plain index)
+            GinIndex(fields=['normalized_title'], opclasses=['gin_trgm_ops'], name='job_normalized_title_trgm'),
+            GinIndex(
+                fields=['normalized_description'], opclasses=['gin_trgm_ops'], name='job_normalized_desc_trgm'
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.title} at {self.company}"
+
+    def save(self, *args, **kwargs):
+        self.refresh_normalized_text()
+        super().save(*args, **kwargs)
+
+    def refresh_normalized_text(self, force=False):
+        """Recompute the normalized fields if the title or description changed
+
+        force=True recomputes them regardless, e.g. after a tokenizer change.
+        Returns True when the fields were recomputed.
+        """
+        new_hash = content_hash(self.title, self.description)
+        if new_hash == self.content_hash and not force:
+            return False
+
+        self.normalized_title = normalize_text(self.title)
+        self.normalized_description = normalize_text(self.description)
+        self.content_hash = new_hash
+        return True
+
+
+class JobLSHBucket(models.Model):
+    """LSH index entry for near-duplicate lookup; see jobs.dedupe"""
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='lsh_buckets')
+    bucket = models.BigIntegerField(db_index=True)
+
+    def __str__(self):
+        return f"{self.job_id} - {self.bucket}"
+
+
+class JobMatch(models.Model):
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='job_matches')
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='matches')
+    job_preference = models.ForeignKey(
+        'users.JobPreference', on_delete=models.SET_NULL, null=True, blank=True, related_name='matches'
+    )
+    match_score = models.FloatField(default=0.0)
+    is_viewed = models.BooleanField(default=False)
+    is_bookmarked = models.BooleanField(default=False)
+    is_applied = models.BooleanField(default=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'job'], name='unique_job_match_per_user'),
+        ]
+
+    def __str__(self):
+        return f"{self.user} - {self.job}"
+
+
+class ScrapeLog(models.Model):
+    STATUS_CHOICES = [
+        ('started', 'Started'),
+        ('completed', 'Completed'),
+        ('failed', 'Failed'),
+    ]
+
+    job_board = models.ForeignKey(JobBoard, on_delete=models.CASCADE, related_name='scrape_logs')
+    scrape_id = models.CharField(max_length=64, blank=True)  # id of the run on the scraper service
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='started')
+    jobs_scraped = models.IntegerField(default=0)
+    jobs_created = models.IntegerField(default=0)
+    jobs_updated = models.IntegerField(default=0)
+    jobs_unchanged = models.IntegerField(default=0)
+    jobs_duplicates = models.IntegerField(default=0)  # linked to a canonical job from another source
+    matches_created = models.IntegerField(default=0)
+    matches_skipped = models.IntegerField(default=0)
+    error_message = models.TextField(blank=True)
+    started_at = models.DateTimeField(auto_now_add=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+    duration = models.DurationField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['-started_at']
+
+    def __str__(self):
+        return f"{self.job_board} - {self.status} ({self.started_at})"
+
+
+class EmailNotification(models.Model):
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='email_notifications')
+    subject = models.CharField(max_length=255)
+    job_matches = models.ManyToManyField(JobMatch, related_name='email_notifications', blank=True)
+    sent_at = models.DateTimeField(auto_now_add=True)
+    is_sent = models.BooleanField(default=False)
+    error_message = models.TextField(blank=True)
+
+    class Meta:
+        ordering = ['-sent_at']
+
+    def __str__(self):
+        return f"{self.user} - {self.subject}"
@@ -0,0 +1,126 @@
+"""Adaptive per-board scrape intervals for the django_celery_beat database scheduler
+
+Every active job board gets its own PeriodicTask running scrape_job_board.
+Its interval is derived from the board's recent ScrapeLog history:
+
+- the rate of new jobs over the last SCRAPE_SCHEDULE_HISTORY runs sets the
+  interval that would yield about SCRAPE_TARGET_NEW_JOBS new jobs per run
+- the failure rate backs the interval off, up to 4x when every run failed
+- the interval never drops below twice the mean scrape duration
+
+and is clamped to [SCRAPE_INTERVAL_MIN, SCRAPE_INTERVAL_MAX] seconds.
+"""
+import json
+import logging
+
+from django.conf import settings
+from django_celery_beat.models import IntervalSchedule, PeriodicTask
+
+from .models import JobBoard, ScrapeLog
+
+logger = logging.getLogger(__name__)
+
+SCRAPE_TASK = 'jobs.tasks.scrape_job_board'
+# Fixed hourly entry that per-board tasks replace
+LEGACY_TASK_NAME = 'scrape-jobs-every-hour'
+FAILURE_BACKOFF = 3
+DURATION_FACTOR = 2
+# Intervals within this fraction of the current one are left alone, so beat isn't reloaded for noise
+MIN_CHANGE = 0.1
+
+
+def periodic_task_name(job_board):
+    return f"scrape-job-board-{job_board.id}"
+
+
+def board_interval(logs):
+    """Seconds between scrapes for a board, given its recent ScrapeLogs oldest first"""
+    interval = settings.SCRAPE_INTERVAL_DEFAULT
+    finished = [log for log in logs if log.status != 'started']
+
+    # Each run's jobs_created are the jobs posted since the run before it
+    if len(finished) >= 2:
+        span = (finished[-1].started_at - finished[0].started_at).total_seconds()
+        created = sum(log.jobs_created for log in finished[1:])
+        if span > 0:
+            interval = settings.SCRAPE_TARGET_NEW_JOBS * span / created if created else settings.SCRAPE_INTERVAL_MAX
+
+    if finished:
+        failure_rate = sum(1 for log in finished if log.status == 'failed') / len(finished)
+        interval *= 1 + FAILURE_BACKOFF * failure_rate
+
+        durations = [log.duration.total_seconds() for log in finished if log.duration]
+        if durations:
+            interval = max(interval, DURATION_FACTOR * sum(durations) / len(durations))
+
+    interval = min(max(interval, settings.SCRAPE_INTERVAL_MIN), settings.SCRAPE_INTERVAL_MAX)
+    # Whole minutes keep the number of IntervalSchedule rows small
+    return max(60, int(round(interval / 60)) * 60)
+
+
+def recent_logs(job_board):
+    logs = ScrapeLog.objects.filter(job_board=job_board).order_by('-started_at')[:settings.SCRAPE_SCHEDULE_HISTORY]
+    return list(reversed(logs))
+
+
+def sync_board_schedule(job_board):
+    """Create or update a board's PeriodicTask; returns its interval in seconds, or None if disabled"""
+    name = periodic_task_name(job_board)
+    task = PeriodicTask.objects.select_related('interval').filter(name=name).first()
+
+    if not job_board.is_active:
+        if task is not None and task.enabled:
+            task.enabled = False
+            task.save(update_fields=['enabled'])
+        return None
+
+    seconds = board_interval(recent_logs(job_board))
+
+    if task is not None and task.enabled and task.interval is not None:
+        current = task.interval.every * _period_seconds(task.interval.period)
+        if abs(seconds - current) < MIN_CHANGE * current:
+            return current
+
+    schedule, _ = IntervalSchedule.objects.get_or_create(every=seconds, period=IntervalSchedule.SECONDS)
+    if task is None:
+        PeriodicTask.objects.create(
+            name=name,
+            task=SCRAPE_TASK,
+            args=json.dumps([job_board.id]),
+            interval=schedule,
+        )
+    else:
+        task.interval = schedule
+        task.enabled = True
+        task.save()
+
+    logger.info(f"Scraping {job_board.name} every {seconds}s")
+    return seconds
+
+
+def sync_board_schedules():
+    """Sync the PeriodicTask of every job board and retire the fixed hourly scrape"""
+    # Saved one by one rather than with update(), so the beat scheduler notices
+    for task in PeriodicTask.objects.filter(name=LEGACY_TASK_NAME, enabled=True):
+        task.enabled = False
+        task.save(update_fields=['enabled'])
+
+    intervals = {}
+    names = set()
+    for job_board in JobBoard.objects.all():
+        intervals[job_board.name] = sync_board_schedule(job_board)
+        names.add(periodic_task_name(job_board))
+
+    for task in PeriodicTask.objects.filter(task=SCRAPE_TASK, name__startswith='scrape-job-board-'):
+        if task.name not in names:
+            task.delete()
+    return intervals
+
+
+def _period_seconds(period):
+    return {
+        IntervalSchedule.SECONDS: 1,
+        IntervalSchedule.MINUTES: 60,
+        IntervalSchedule.HOURS: 3600,
+        IntervalSchedule.DAYS: 86400,
+    }.get(period, 1)
@@ -0,0 +1,76 @@
+"""Client for the FastAPI scraper service's scrape registry"""
+import os
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+FINISHED_STATUSES = ('completed', 'failed', 'timeout', 'cancelled')
+
+_session = None
+_session_pid = None
+
+
+def get_session():
+    """Keep-alive session shared by every call to the scraper service from this process
+
+    Prefork workers inherit module state from the parent, so a session
+    created before the fork is replaced rather than shared across processes.
+    """
+    global _session, _session_pid
+    if _session is None or _session_pid != os.getpid():
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=settings.SCRAPER_POOL_SIZE)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        _session, _session_pid = session, os.getpid()
+    return _session
+
+
+def start_scrape(job_board):
+    """Start a scrape of a job board; returns the scraper service's response
+
+    Postings delivered by earlier scrapes are skipped, but they only count as
+    delivered once ack_scrape is called after they have been ingested.
+    """
+    request = dict(job_board.scraper_config)
+    # A board may ask for a shorter deadline, never for one poll_scrape would give up on first
+    request['timeout'] = min(request.get('timeout') or settings.SCRAPER_RUN_TIMEOUT, settings.SCRAPER_RUN_TIMEOUT)
+    request['job_board_config'] = {'skip_seen': True, 'ack_seen': True, **request.get('job_board_config', {})}
+    return get_session().post(
+        f"{settings.SCRAPER_SERVICE_URL}/scrape/{job_board.name.lower()}",
+        json=request,
+        timeout=30
+    )
+
+
+def ack_scrape(scrape_id):
+    """Tell the scraper service a finished scrape's postings are stored, so later scrapes skip them"""
+    response = get_session().post(f"{settings.SCRAPER_SERVICE_URL}/scrape/{scrape_id}/ack", timeout=60)
+    response.raise_for_status()
+    return response.json()
+
+
+def get_scrape_status(scrape_id):
+    response = get_session().get(f"{settings.SCRAPER_SERVICE_URL}/scrape/{scrape_id}", timeout=30)
+    response.raise_for_status()
+    return response.json()
+
+
+def iter_scrape_results(scrape_id, page_size=None):
+    """Yield pages (lists of JobData dicts) of a finished scrape's results"""
+    page_size = page_size or settings.SCRAPER_RESULTS_PAGE_SIZE
+    offset = 0
+
+    while True:
+        response = get_session().get(
+            f"{settings.SCRAPER_SERVICE_URL}/scrape/{scrape_id}/results",
+            params={'offset': offset, 'limit': page_size},
+            timeout=60
+        )
+        response.raise_for_status()
+        jobs = response.json()['jobs']
+        if not jobs:
+            return
+        yield jobs
+        offset += len(jobs)
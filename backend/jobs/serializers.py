@@ -38,8 +38,8 @@ class ScrapeLogSerializer(serializers.ModelSerializer):
     class Meta:
         model = ScrapeLog
         fields = [
-            'id', 'job_board_name', 'status', 'jobs_scraped', 'jobs_created',
-            'jobs_updated', 'error_message', 'started_at', 'completed_at',
+            'id', 'job_board_name', 'scrape_id', 'status', 'jobs_scraped', 'jobs_created',
+            'jobs_updated', 'jobs_unchanged', 'jobs_duplicates', 'matches_created', 'matches_skipped', 'error_message', 'started_at', 'completed_at',
             'duration_seconds'
         ]
         read_only_fields = ['id']
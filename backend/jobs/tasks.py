@@ -1,13 +1,25 @@
-from celery import shared_task
+from celery import chord, shared_task
 from django.core.mail import send_mail
 from django.conf import settings
 from django.template.loader import render_to_string
+from django.db.models import Max
 from django.utils import timezone
 from datetime import timedelta
-import requests
 import logging
+import numpy as np
+import redis
+import requests
+from scipy import sparse
 
 from .models import Job, JobBoard, JobMatch, ScrapeLog, EmailNotification
+from .matching import (
+    ConstraintFilter, KeywordIndex, MatchWriter, load_matched_pairs, preference_candidate_jobs
+)
+from .ingest import ingest_jobs
+from .locks import TaskLease
+from .scheduling import sync_board_schedule, sync_board_schedules
+from .scraper_client import FINISHED_STATUSES, ack_scrape, get_scrape_status, iter_scrape_results, start_scrape
+from .text import job_search_fields, normalize_keyword
 from users.models import User, JobPreference
 
 logger = logging.getLogger(__name__)
@@ -22,9 +34,44 @@ def scrape_all_jobs():
     
     logger.info(f"Initiated scraping for {job_boards.count()} job boards")
 
+@shared_task
+def update_scrape_schedules():
+    """Re-derive every job board's scrape interval from its recent scrape logs"""
+    intervals = sync_board_schedules()
+    logger.info(f"Updated scrape schedules: {intervals}")
+
+@shared_task
+def update_board_schedule(job_board_id):
+    """Re-derive one job board's scrape interval after a scrape of it completes"""
+    try:
+        job_board = JobBoard.objects.get(id=job_board_id)
+        seconds = sync_board_schedule(job_board)
+        logger.info(f"Updated scrape schedule of {job_board.name}: {seconds}s")
+        
+    except JobBoard.DoesNotExist:
+        logger.error(f"Job board with id {job_board_id} not found")
+    except Exception as e:
+        logger.error(f"Error updating scrape schedule of job board {job_board_id}: {str(e)}")
+
 @shared_task
 def scrape_job_board(job_board_id):
-    """Scrape jobs from a specific job board"""
+    """Start a scrape of a specific job board
+
+    Returns as soon as the scraper service has accepted the scrape; poll_scrape
+    ingests its results once it finishes, so no worker waits on the scrape.
+    A request for a board that is still being scraped is skipped, since the
+    scrape in flight fetches the same listings.
+    """
+    try:
+        lease = TaskLease('scrape_job_board', job_board_id)
+        lease_token = lease.acquire()
+    except redis.RedisError as e:
+        logger.error(f"Error acquiring scrape lease for job board {job_board_id}: {str(e)}")
+        return
+    if lease_token is None:
+        logger.info(f"Skipping scrape of job board {job_board_id}: a scrape is already in progress")
+        return
+    
     try:
         job_board = JobBoard.objects.get(id=job_board_id)
         
@@ -34,110 +81,436 @@ def scrape_job_board(job_board_id):
             status='started'
         )
         
-        # Call FastAPI scraper service
-        response = requests.post(
-            f"{settings.SCRAPER_SERVICE_URL}/scrape/{job_board.name.lower()}",
-            json=job_board.scraper_config,
-            timeout=300
-        )
+        # Submit the scrape to the FastAPI scraper service
+        response = start_scrape(job_board)
         
         if response.status_code == 200:
-            data = response.json()
+            scrape_log.scrape_id = response.json()['scrape_id']
+            scrape_log.save(update_fields=['scrape_id'])
             
-            # Update scrape log
-            scrape_log.status = 'completed'
-            scrape_log.jobs_scraped = data.get('jobs_scraped', 0)
-            scrape_log.jobs_created = data.get('jobs_created', 0)
-            scrape_log.jobs_updated = data.get('jobs_updated', 0)
-            scrape_log.completed_at = timezone.now()
-            scrape_log.duration = scrape_log.completed_at - scrape_log.started_at
-            scrape_log.save()
+            poll_scrape.apply_async(args=[scrape_log.id, lease_token], countdown=settings.SCRAPER_POLL_INTERVAL)
             
-            # Trigger job matching for new jobs
-            match_new_jobs.delay(job_board_id)
-            
-            logger.info(f"Successfully scraped {data.get('jobs_scraped', 0)} jobs from {job_board.name}")
+            logger.info(f"Started scrape {scrape_log.scrape_id} of {job_board.name}")
         else:
-            scrape_log.status = 'failed'
-            scrape_log.error_message = f"HTTP {response.status_code}: {response.text}"
-            scrape_log.completed_at = timezone.now()
-            scrape_log.duration = scrape_log.completed_at - scrape_log.started_at
-            scrape_log.save()
+            _fail_scrape_log(scrape_log, f"HTTP {response.status_code}: {response.text}")
+            lease.release(lease_token)
             
             logger.error(f"Failed to scrape {job_board.name}: {response.text}")
             
     except JobBoard.DoesNotExist:
+        lease.release(lease_token)
         logger.error(f"Job board with id {job_board_id} not found")
     except Exception as e:
+        lease.release(lease_token)
         logger.error(f"Error scraping job board {job_board_id}: {str(e)}")
         
         # Update scrape log if it exists
         try:
-            scrape_log.status = 'failed'
-            scrape_log.error_message = str(e)
-            scrape_log.completed_at = timezone.now()
-            scrape_log.duration = scrape_log.completed_at - scrape_log.started_at
-            scrape_log.save()
+            _fail_scrape_log(scrape_log, str(e))
+        except:
+            pass
+
+@shared_task
+def poll_scrape(scrape_log_id, lease_token=None):
+    """Check on a submitted scrape and finalize it once the scraper service has finished
+
+    Reschedules itself every SCRAPER_POLL_INTERVAL seconds until the scrape
+    finishes or SCRAPER_TIMEOUT seconds have passed since it was submitted,
+    renewing the board's scrape lease on every poll.
+    """
+    lease = None
+    try:
+        scrape_log = ScrapeLog.objects.select_related('job_board').get(id=scrape_log_id)
+        
+        # A redelivered poll for a scrape that was already finalized
+        if scrape_log.status != 'started':
+            return
+        
+        if lease_token:
+            lease = TaskLease('scrape_job_board', scrape_log.job_board_id)
+            try:
+                if not lease.renew(lease_token):
+                    # Expired and possibly taken by another run; never release that one
+                    lease = None
+            except redis.RedisError as e:
+                # The scrape itself is unaffected, so keep polling and finalizing
+                logger.warning(f"Could not renew the scrape lease for scrape {scrape_log.scrape_id}: {str(e)}")
+        
+        timed_out = timezone.now() - scrape_log.started_at >= timedelta(seconds=settings.SCRAPER_TIMEOUT)
+        
+        try:
+            status = get_scrape_status(scrape_log.scrape_id)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if timed_out:
+                raise
+            logger.warning(f"Could not reach the scraper service for scrape {scrape_log.scrape_id}: {str(e)}")
+            status = None
+        
+        if status is None or status['status'] not in FINISHED_STATUSES:
+            if timed_out:
+                raise TimeoutError(
+                    f"Scrape {scrape_log.scrape_id} did not finish within {settings.SCRAPER_TIMEOUT}s"
+                )
+            poll_scrape.apply_async(args=[scrape_log_id, lease_token], countdown=settings.SCRAPER_POLL_INTERVAL)
+            return
+        
+        finalize_scrape(scrape_log, status)
+        if lease is not None:
+            lease.release(lease_token)
+        
+    except ScrapeLog.DoesNotExist:
+        logger.error(f"Scrape log with id {scrape_log_id} not found")
+    except Exception as e:
+        logger.error(f"Error finalizing scrape log {scrape_log_id}: {str(e)}")
+        
+        if lease is not None:
+            lease.release(lease_token)
+        try:
+            _fail_scrape_log(scrape_log, str(e))
         except:
             pass
 
+def finalize_scrape(scrape_log, status):
+    """Ingest a finished scrape's results, complete its log and trigger matching"""
+    job_board = scrape_log.job_board
+    
+    if status['status'] not in ('completed', 'timeout'):
+        raise RuntimeError(f"Scrape {scrape_log.scrape_id} {status['status']}: {status.get('error') or ''}")
+    
+    counts = {'created': 0, 'updated': 0, 'unchanged': 0, 'duplicates': 0}
+    updated_job_ids = []
+    for jobs in iter_scrape_results(scrape_log.scrape_id):
+        page_counts = ingest_jobs(job_board, jobs)
+        updated_job_ids.extend(page_counts.pop('updated_job_ids'))
+        for key, value in page_counts.items():
+            counts[key] += value
+    
+    # Update scrape log
+    scrape_log.status = 'completed'
+    scrape_log.jobs_scraped = status['jobs_scraped']
+    scrape_log.jobs_created = counts['created']
+    scrape_log.jobs_updated = counts['updated']
+    scrape_log.jobs_unchanged = counts['unchanged']
+    scrape_log.jobs_duplicates = counts['duplicates']
+    if status['status'] == 'timeout':
+        # Partial results are still ingested
+        scrape_log.error_message = status.get('error') or 'Scrape timed out'
+    scrape_log.completed_at = timezone.now()
+    scrape_log.duration = scrape_log.completed_at - scrape_log.started_at
+    scrape_log.save()
+    
+    # Only now that the postings are stored may later scrapes skip them; if
+    # the ack fails they are re-delivered and ingested as unchanged
+    try:
+        ack_scrape(scrape_log.scrape_id)
+    except requests.RequestException as e:
+        logger.error(f"Error acknowledging scrape {scrape_log.scrape_id}: {str(e)}")
+    
+    # Trigger job matching for new jobs, and re-match updated ones that were matched before
+    match_new_jobs.delay(job_board.id, scrape_log.id)
+    if updated_job_ids:
+        match_updated_jobs.delay(job_board.id, updated_job_ids)
+    
+    # Adjust the board's interval to the yield of this run; a separate task, so
+    # a scheduling error can't fail a scrape whose jobs are already ingested
+    update_board_schedule.delay(job_board.id)
+    
+    logger.info(f"Successfully scraped {status['jobs_scraped']} jobs from {job_board.name}")
+
+def _fail_scrape_log(scrape_log, error_message):
+    scrape_log.status = 'failed'
+    scrape_log.error_message = error_message
+    scrape_log.completed_at = timezone.now()
+    scrape_log.duration = scrape_log.completed_at - scrape_log.started_at
+    scrape_log.save()
+
 @shared_task
-def match_new_jobs(job_board_id):
-    """Match new jobs with user preferences"""
+def match_new_jobs(job_board_id, scrape_log_id=None):
+    """Match new jobs with user preferences
+
+    The new jobs are split into id ranges of MATCH_SHARD_SIZE jobs, matched in
+    parallel against every active preference by match_job_shard, so each
+    job's text is loaded and scanned once per run; finalize_match_run
+    combines the shard counts once all of them have succeeded. Only one run per board is in
+    flight at a time; requests made meanwhile coalesce into a single follow-up
+    run, so jobs ingested during a run are still matched.
+    """
+    try:
+        lease = TaskLease('match_new_jobs', job_board_id)
+        lease_token = lease.acquire(coalesce=True, args=[job_board_id, scrape_log_id])
+    except redis.RedisError as e:
+        # Nothing is lost: the next run matches from the board's unchanged high-water mark
+        logger.error(f"Error acquiring match lease for job board {job_board_id}: {str(e)}")
+        return
+    if lease_token is None:
+        logger.info(f"Matching for job board {job_board_id} already in progress; queued a follow-up run")
+        return
+    
     try:
         job_board = JobBoard.objects.get(id=job_board_id)
         
-        # Get jobs from the last scrape
-        recent_jobs = Job.objects.filter(
-            job_board=job_board,
-            scraped_at__gte=timezone.now() - timedelta(hours=2),
-            is_active=True
+        # Get jobs ingested since the last successful run, up to a fixed high-water mark
+        low_water_mark = job_board.last_matched_job_id
+        new_jobs = Job.objects.filter(job_board=job_board, id__gt=low_water_mark)
+        high_water_mark = new_jobs.aggregate(Max('id'))['id__max']
+
+        if high_water_mark is None:
+            lease.release(lease_token, follow_up=match_new_jobs)
+            logger.info(f"No new jobs to match for {job_board.name}")
+            return
+
+        # Shard by job id range; disjoint ranges can never create the same (user, job) pair
+        job_ids = list(
+            new_jobs.filter(id__lte=high_water_mark, is_active=True, canonical_job__isnull=True)
+            .order_by('id')
+            .values_list('id', flat=True)
         )
+        shard_size = settings.MATCH_SHARD_SIZE
+        bounds = [low_water_mark] + job_ids[shard_size - 1:-1:shard_size] + [high_water_mark]
+        shards = list(zip(bounds, bounds[1:]))
+
+        callback = finalize_match_run.s(job_board_id, high_water_mark, scrape_log_id, lease_token)
+
+        if not job_ids or not JobPreference.objects.filter(is_active=True).exists():
+            callback.delay([])
+            return
+
+        chord(
+            match_job_shard.s(job_board_id, shard_low, shard_high, lease_token)
+            for shard_low, shard_high in shards
+        )(callback)
+
+        logger.info(f"Dispatched {len(shards)} matching shards for {job_board.name}")
         
-        # Get all active job preferences
-        preferences = JobPreference.objects.filter(is_active=True)
+    except JobBoard.DoesNotExist:
+        lease.release(lease_token)
+        logger.error(f"Job board with id {job_board_id} not found")
+    except Exception as e:
+        lease.release(lease_token, follow_up=match_new_jobs)
+        logger.error(f"Error matching jobs for job board {job_board_id}: {str(e)}")
+
+@shared_task(autoretry_for=(Exception,), retry_backoff=True, retry_kwargs={'max_retries': 3})
+def match_job_shard(job_board_id, low_water_mark, high_water_mark, lease_token=None):
+    """Match the jobs in (low_water_mark, high_water_mark] against every active preference
+
+    Exceptions propagate so that only the failing shard is retried. If a shard
+    keeps failing, the board's match lease expires after TASK_LOCK_TTL.
+    """
+    if lease_token:
+        TaskLease('match_new_jobs', job_board_id).renew(lease_token)
+
+    # Duplicates of a canonical job from another source are matched through the canonical job only
+    recent_jobs = Job.objects.filter(
+        job_board_id=job_board_id,
+        id__gt=low_water_mark,
+        id__lte=high_water_mark,
+        is_active=True,
+        canonical_job__isnull=True
+    ).order_by('id')
+
+    return _match_jobs(recent_jobs)
+
+@shared_task
+def match_updated_jobs(job_board_id, job_ids):
+    """Match jobs whose scraped fields changed after match_new_jobs already matched them
+
+    Updated postings keep their id, so they stay below the board's
+    last_matched_job_id; jobs above it are left to match_new_jobs. Pairs that
+    are already matched are kept as they are.
+    """
+    try:
+        job_board = JobBoard.objects.get(id=job_board_id)
+        
+        updated_jobs = Job.objects.filter(
+            job_board=job_board,
+            id__in=job_ids,
+            id__lte=job_board.last_matched_job_id,
+            is_active=True,
+            canonical_job__isnull=True
+        )
+        matched_ids = list(updated_jobs.order_by('id').values_list('id', flat=True))
         
         matches_created = 0
+        shard_size = settings.MATCH_SHARD_SIZE
+        for start in range(0, len(matched_ids), shard_size):
+            result = _match_jobs(Job.objects.filter(id__in=matched_ids[start:start + shard_size]).order_by('id'))
+            matches_created += result['matches_created']
         
-        for preference in preferences:
-            keywords = preference.get_keywords_list()
-            
-            for job in recent_jobs:
-                # Check if match already exists
-                if JobMatch.objects.filter(user=preference.user, job=job).exists():
-                    continue
-                
-                # Calculate match score
-                match_score = calculate_match_score(job, preference, keywords)
-                
-                if match_score > 0.3:  # Minimum threshold for matching
-                    JobMatch.objects.create(
-                        user=preference.user,
-                        job=job,
-                        job_preference=preference,
-                        match_score=match_score
-                    )
-                    matches_created += 1
-        
-        logger.info(f"Created {matches_created} new job matches for {job_board.name}")
+        logger.info(
+            f"Created {matches_created} job matches for {len(matched_ids)} updated jobs of {job_board.name}"
+        )
         
     except JobBoard.DoesNotExist:
         logger.error(f"Job board with id {job_board_id} not found")
     except Exception as e:
-        logger.error(f"Error matching jobs for job board {job_board_id}: {str(e)}")
+        logger.error(f"Error matching updated jobs for job board {job_board_id}: {str(e)}")
+
+def _match_jobs(recent_jobs):
+    """Match a queryset of jobs against every active preference; returns created and skipped counts"""
+    # Every shard indexes the same preferences, so workers reuse the cached keyword automaton
+    preferences = list(JobPreference.objects.filter(is_active=True))
+    keyword_index = KeywordIndex(preferences)
+
+    # Resolve salary / location / job type constraints in SQL before any scoring
+    constraints = ConstraintFilter(recent_jobs, preferences)
+
+    # Load the pairs that are already matched in one query
+    matched_pairs = load_matched_pairs(recent_jobs)
+    existing_count = len(matched_pairs)
+
+    writer = MatchWriter(batch_size=settings.MATCH_BULK_BATCH_SIZE)
+    matches_skipped = 0
+
+    if settings.MATCH_SCORING_MODE == 'batch':
+        scored_candidates = _iter_batch_scored_candidates(
+            recent_jobs, keyword_index, settings.MATCH_SCORING_BATCH_SIZE, constraints
+        )
+    else:
+        scored_candidates = _iter_scored_candidates(recent_jobs, keyword_index, constraints)
+
+    for job, preference, match_score in scored_candidates:
+        if match_score <= 0.3:  # Minimum threshold for matching
+            continue
+
+        pair = (preference.user_id, job.id)
+        if pair in matched_pairs:
+            matches_skipped += 1
+            continue
+
+        writer.add(JobMatch(
+            user_id=preference.user_id,
+            job=job,
+            job_preference=preference,
+            match_score=match_score
+        ))
+        matched_pairs.add(pair)
+
+    writer.flush()
+
+    # Rows lost to ignore_conflicts were matched concurrently by another run
+    matches_created = JobMatch.objects.filter(job__in=recent_jobs).count() - existing_count
+    matches_skipped += writer.written - matches_created
+
+    return {'matches_created': matches_created, 'matches_skipped': matches_skipped}
+
+@shared_task
+def finalize_match_run(shard_results, job_board_id, high_water_mark, scrape_log_id=None, lease_token=None):
+    """Combine shard counts, advance the board's mark and update its scrape log, then release the run's lease"""
+    matches_created = sum(result['matches_created'] for result in shard_results)
+    matches_skipped = sum(result['matches_skipped'] for result in shard_results)
+
+    # Only advance the mark once every shard has committed its matches
+    JobBoard.objects.filter(
+        id=job_board_id,
+        last_matched_job_id__lt=high_water_mark
+    ).update(last_matched_job_id=high_water_mark)
+
+    if scrape_log_id:
+        ScrapeLog.objects.filter(id=scrape_log_id).update(
+            matches_created=matches_created,
+            matches_skipped=matches_skipped
+        )
+
+    if lease_token:
+        TaskLease('match_new_jobs', job_board_id).release(lease_token, follow_up=match_new_jobs)
+
+    logger.info(
+        f"Created {matches_created} new job matches for job board {job_board_id} "
+        f"across {len(shard_results)} shards ({matches_skipped} skipped)"
+    )
+
+def schedule_preference_match(preference):
+    """Queue reverse matching for a created or edited preference
+
+    The task is delayed and carries the preference's updated_at, so a burst of
+    edits collapses into the run queued by the last one.
+    """
+    match_preference_jobs.apply_async(
+        args=[preference.id, preference.updated_at.isoformat()],
+        countdown=settings.PREFERENCE_MATCH_DEBOUNCE
+    )
+
+@shared_task
+def match_preference_jobs(preference_id, preference_version):
+    """Match existing active jobs against a created or edited job preference"""
+    try:
+        preference = JobPreference.objects.select_related('user').get(id=preference_id)
+
+        if preference.updated_at.isoformat() != preference_version:
+            logger.info(f"Skipping reverse matching for preference {preference_id}: superseded by a newer edit")
+            return
+
+        keywords = preference.get_keywords_list()
+        if not preference.is_active or not keywords:
+            return
+
+        keyword_index = KeywordIndex([preference])
+        candidates = preference_candidate_jobs(preference, keywords).only(
+            'id', 'title', 'description', 'normalized_title', 'normalized_description',
+            'content_hash', 'location_type', 'job_type', 'salary_min', 'salary_max'
+        ).order_by('id')
+
+        writer = MatchWriter(batch_size=settings.MATCH_BULK_BATCH_SIZE)
+        chunk_size = settings.PREFERENCE_MATCH_CHUNK_SIZE
+        chunk = []
+
+        # Stream candidates in chunks so the jobs table is never loaded at once
+        for job in candidates.iterator(chunk_size=chunk_size):
+            chunk.append(job)
+            if len(chunk) >= chunk_size:
+                _match_preference_chunk(preference, chunk, keyword_index, writer)
+                chunk = []
+
+        if chunk:
+            _match_preference_chunk(preference, chunk, keyword_index, writer)
+
+        writer.flush()
+
+        logger.info(f"Reverse matching wrote {writer.written} job matches for preference {preference_id}")
+
+    except JobPreference.DoesNotExist:
+        logger.error(f"Job preference with id {preference_id} not found")
+    except Exception as e:
+        logger.error(f"Error reverse matching preference {preference_id}: {str(e)}")
+
+def _match_preference_chunk(preference, jobs, keyword_index, writer):
+    """Score one chunk of candidate jobs for a preference and queue the new matches"""
+    matched_job_ids = set(JobMatch.objects.filter(
+        user_id=preference.user_id,
+        job_id__in=[job.id for job in jobs]
+    ).values_list('job_id', flat=True))
+
+    for job, matched_preference, match_score in _iter_scored_candidates(jobs, keyword_index):
+        if match_score > 0.3 and job.id not in matched_job_ids:  # Minimum threshold for matching
+            writer.add(JobMatch(
+                user_id=preference.user_id,
+                job=job,
+                job_preference=preference,
+                match_score=match_score
+            ))
 
 def calculate_match_score(job, preference, keywords):
     """Calculate match score between job and user preference"""
+    title, description = job_search_fields(job)
+    normalized_keywords = [keyword for keyword in map(normalize_keyword, keywords) if keyword]
+
+    title_hits = {keyword for keyword in normalized_keywords if keyword in title}
+    description_hits = {keyword for keyword in normalized_keywords if keyword in description}
+
+    return score_keyword_hits(job, preference, keywords, title_hits, description_hits)
+
+def score_keyword_hits(job, preference, keywords, title_hits, description_hits):
+    """Calculate match score from the keywords already found in the job title and description"""
     score = 0.0
     
     # Check keywords in title (weight: 0.4)
     title_matches = sum(1 for keyword in keywords 
-                       if keyword.lower() in job.title.lower())
+                       if normalize_keyword(keyword) in title_hits)
     score += (title_matches / len(keywords)) * 0.4
     
     # Check keywords in description (weight: 0.3)
     description_matches = sum(1 for keyword in keywords 
-                            if keyword.lower() in job.description.lower())
+                            if normalize_keyword(keyword) in description_hits)
     score += (description_matches / len(keywords)) * 0.3
     
     # Check location type match (weight: 0.2)
@@ -150,6 +523,100 @@ def calculate_match_score(job, preference, keywords):
     
     return min(score, 1.0)
 
+def calculate_match_scores(jobs, keyword_index):
+    """Score a batch of jobs against every indexed preference at once
+
+    Returns a sparse (len(jobs), len(keyword_index)) matrix in COO format,
+    preference columns following keyword_index.preference_list(). Only pairs
+    with at least one keyword hit are stored, and each stored score is equal
+    to what calculate_match_score returns for that pair.
+    """
+    preferences = keyword_index.preference_list()
+    vocabulary = {keyword: column for column, keyword in enumerate(keyword_index.index)}
+    shape = (len(jobs), len(preferences))
+
+    # Job x keyword hit matrices for the title and description
+    title_rows, title_cols, description_rows, description_cols = [], [], [], []
+    for row, job in enumerate(jobs):
+        title_hits, description_hits = keyword_index.scan(job)
+        for keyword in title_hits:
+            title_rows.append(row)
+            title_cols.append(vocabulary[keyword])
+        for keyword in description_hits:
+            description_rows.append(row)
+            description_cols.append(vocabulary[keyword])
+
+    hit_shape = (len(jobs), len(vocabulary))
+    title_hits = sparse.csr_matrix(
+        (np.ones(len(title_rows), dtype=np.int32), (title_rows, title_cols)), shape=hit_shape
+    )
+    description_hits = sparse.csr_matrix(
+        (np.ones(len(description_rows), dtype=np.int32), (description_rows, description_cols)), shape=hit_shape
+    )
+
+    # Keyword x preference occurrence counts (duplicate keywords count twice, like the scalar path)
+    count_rows, count_cols = [], []
+    for column, (preference, keywords) in enumerate(preferences):
+        for keyword in map(normalize_keyword, keywords):
+            if keyword:
+                count_rows.append(vocabulary[keyword])
+                count_cols.append(column)
+    keyword_counts = sparse.csr_matrix(
+        (np.ones(len(count_rows), dtype=np.int32), (count_rows, count_cols)), shape=(len(vocabulary), len(preferences))
+    )
+
+    title_matches = title_hits @ keyword_counts
+    description_matches = description_hits @ keyword_counts
+
+    # Only pairs with a keyword hit are candidates, same as KeywordIndex.candidates
+    candidates = title_matches + description_matches
+    candidates.sort_indices()
+    rows, cols = candidates.nonzero()
+    if not len(rows):
+        return sparse.coo_matrix(shape)
+
+    lengths = np.array([len(keywords) for _, keywords in preferences], dtype=np.float64)[cols]
+    job_location_types = np.array([job.location_type for job in jobs], dtype=object)[rows]
+    job_types = np.array([job.job_type for job in jobs], dtype=object)[rows]
+    preference_location_types = np.array([p.location_type for p, _ in preferences], dtype=object)[cols]
+    preference_job_types = np.array([p.job_type for p, _ in preferences], dtype=object)[cols]
+
+    # Same weights and order of additions as score_keyword_hits, so results are bit-identical
+    scores = (np.asarray(title_matches[rows, cols]).ravel() / lengths) * 0.4
+    scores = scores + (np.asarray(description_matches[rows, cols]).ravel() / lengths) * 0.3
+    scores = scores + np.where(job_location_types == preference_location_types, 0.2, 0.0)
+    scores = scores + np.where(job_types == preference_job_types, 0.1, 0.0)
+    scores = np.minimum(scores, 1.0)
+
+    return sparse.coo_matrix((scores, (rows, cols)), shape=shape)
+
+def _iter_scored_candidates(jobs, keyword_index, constraints=None):
+    """Yield (job, preference, score) for candidate pairs, one pair at a time"""
+    for job in jobs:
+        # Scan the job text once, then only score preferences with a keyword hit
+        title_hits, description_hits = keyword_index.scan(job)
+
+        for preference, keywords in keyword_index.candidates(title_hits | description_hits):
+            if constraints and not constraints.allows(job, preference):
+                continue
+            yield job, preference, score_keyword_hits(job, preference, keywords, title_hits, description_hits)
+
+def _iter_batch_scored_candidates(jobs, keyword_index, batch_size, constraints=None):
+    """Yield (job, preference, score) for candidate pairs above the threshold, scored in batches"""
+    preferences = keyword_index.preference_list()
+    jobs = list(jobs)
+
+    for start in range(0, len(jobs), batch_size):
+        batch = jobs[start:start + batch_size]
+        scores = calculate_match_scores(batch, keyword_index)
+
+        mask = scores.data > 0.3  # Minimum threshold for matching
+        for row, col, score in zip(scores.row[mask], scores.col[mask], scores.data[mask]):
+            job, preference = batch[row], preferences[col][0]
+            if constraints and not constraints.allows(job, preference):
+                continue
+            yield job, preference, float(score)
+
 @shared_task
 def send_job_alerts():
     """Send email alerts for new job matches"""
@@ -163,6 +630,7 @@ def send_job_alerts():
         new_matches = JobMatch.objects.filter(
             user=preference.user,
             is_viewed=False,
+            job__canonical_job__isnull=True,
             created_at__gte=timezone.now() - timedelta(hours=24)
         ).select_related('job')
         
@@ -0,0 +1,74 @@
+import hashlib
+import html
+import re
+from functools import lru_cache
+
+from django.conf import settings
+
+_SCRIPT_STYLE_RE = re.compile(r'<(script|style)\b.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r'<[^>]+>')
+# Keeps tech terms such as c++, c#, node.js, front-end and .net (with its leading dot) in one token
+_TOKEN_RE = re.compile(r"\.?[\w+#]+(?:[.'\-][\w+#]+)*")
+_STEM_SUFFIXES = ('ing', 'ers', 'er', 'ed', 'es', 's')
+
+
+def strip_html(text):
+    """Remove markup from scraped descriptions (RemoteOK descriptions are HTML)"""
+    if not text:
+        return ''
+    text = _SCRIPT_STYLE_RE.sub(' ', text)
+    text = _TAG_RE.sub(' ', text)
+    return html.unescape(text)
+
+
+def stem_token(token):
+    """Strip a common English suffix, keeping at least three characters"""
+    for suffix in _STEM_SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3:
+            return token[:-len(suffix)]
+    return token
+
+
+def tokenize(text, stem=None):
+    """Split text into lowercased tokens, optionally stemmed"""
+    if stem is None:
+        stem = settings.JOB_TEXT_STEMMING
+
+    tokens = _TOKEN_RE.findall(strip_html(text).lower())
+    if stem:
+        tokens = [stem_token(token) for token in tokens]
+    return tokens
+
+
+def normalize_text(text):
+    """Return text as space-separated normalized tokens
+
+    Keywords and job text go through the same function, so a keyword phrase
+    can still be found as a substring of the normalized job text.
+    """
+    return ' '.join(tokenize(text))
+
+
+@lru_cache(maxsize=65536)
+def normalize_keyword(keyword):
+    return normalize_text(keyword)
+
+
+def content_hash(title, description):
+    """Hash of the raw text the normalized fields are computed from"""
+    digest = hashlib.sha256()
+    digest.update((title or '').encode('utf-8'))
+    digest.update(b'\0')
+    digest.update((description or '').encode('utf-8'))
+    return digest.hexdigest()
+
+
+def job_search_fields(job):
+    """Return the normalized (title, description) of a job
+
+    Falls back to normalizing the raw fields for rows that were saved before
+    the normalized fields existed.
+    """
+    if job.content_hash:
+        return job.normalized_title, job.normalized_description
+    return normalize_text(job.title), normalize_text(job.description)
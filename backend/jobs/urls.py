@@ -11,4 +11,5 @@ urlpatterns = [
     path('boards/', views.JobBoardListView.as_view(), name='job_boards'),
     path('scrape-logs/', views.ScrapeLogListView.as_view(), name='scrape_logs'),
     path('dashboard/', views.dashboard_stats, name='dashboard_stats'),
+    path('task-locks/', views.task_lock_stats, name='task_lock_stats'),
 ]
\ No newline at end of file
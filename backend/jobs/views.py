@@ -4,8 +4,10 @@ from rest_framework.response import Response
 from django.db.models import Q
 from django.utils import timezone
 from datetime import timedelta
+from .locks import lock_metrics
 from .models import Job, JobMatch, JobBoard, ScrapeLog
 from .serializers import JobSerializer, JobMatchSerializer, JobBoardSerializer, ScrapeLogSerializer
+from .text import normalize_text
 
 class JobListView(generics.ListAPIView):
     serializer_class = JobSerializer
@@ -17,11 +19,12 @@ class JobListView(generics.ListAPIView):
         # Filter by search query
         search = self.request.query_params.get('search', None)
         if search:
-            queryset = queryset.filter(
-                Q(title__icontains=search) | 
-                Q(company__icontains=search) | 
-                Q(description__icontains=search)
-            )
+            search_q = Q(title__icontains=search) | Q(company__icontains=search)
+            # A search of only punctuation normalizes to '', which every description contains
+            normalized_search = normalize_text(search)
+            if normalized_search:
+                search_q |= Q(normalized_description__contains=normalized_search)
+            queryset = queryset.filter(search_q)
         
         # Filter by location type
         location_type = self.request.query_params.get('location_type', None)
@@ -145,4 +148,10 @@ def dashboard_stats(request):
         'applied_jobs': applied_jobs,
         'recent_scrapes': recent_scrapes,
         'total_jobs': total_jobs,
-    })
\ No newline at end of file
+    })
+
+@api_view(['GET'])
+@permission_classes([permissions.IsAdminUser])
+def task_lock_stats(request):
+    """Per-task lease counts: acquired, skipped, coalesced, lost, waits and wait_seconds"""
+    return Response(lock_metrics())
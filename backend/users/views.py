@@ -4,11 +4,13 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny
 from rest_framework_simplejwt.tokens import RefreshToken
 from django.contrib.auth import get_user_model
+from django.db import transaction
 from .serializers import (
     UserRegistrationSerializer, UserLoginSerializer, 
     UserSerializer, JobPreferenceSerializer
 )
 from .models import JobPreference
+from jobs.tasks import schedule_preference_match
 
 User = get_user_model()
 
@@ -64,11 +66,16 @@ class JobPreferenceListCreateView(generics.ListCreateAPIView):
         return JobPreference.objects.filter(user=self.request.user)
 
     def perform_create(self, serializer):
-        serializer.save(user=self.request.user)
+        preference = serializer.save(user=self.request.user)
+        transaction.on_commit(lambda: schedule_preference_match(preference))
 
 class JobPreferenceDetailView(generics.RetrieveUpdateDestroyAPIView):
     serializer_class = JobPreferenceSerializer
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        return JobPreference.objects.filter(user=self.request.user)
\ No newline at end of file
+        return JobPreference.objects.filter(user=self.request.user)
+
+    def perform_update(self, serializer):
+        preference = serializer.save()
+        transaction.on_commit(lambda: schedule_preference_match(preference))
\ No newline at end of file
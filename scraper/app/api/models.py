@@ -22,7 +22,17 @@ class ScrapeRequest(BaseModel):
     keywords: List[str] = Field(default=[], description="Keywords to search for")
     location: str = Field(default="", description="Location to search in")
     max_pages: int = Field(default=3, description="Maximum number of pages to scrape")
-    job_board_config: Dict[str, Any] = Field(default={}, description="Job board specific configuration")
+    timeout: Optional[float] = Field(default=None, gt=0, description="Deadline in seconds; a scrape past it ends as 'timeout' with the jobs scraped so far")
+    job_board_config: Dict[str, Any] = Field(
+        default={},
+        description="Job board specific configuration, e.g. concurrency for page fetching, requests_per_second and burst to scrape slower than the host's limit (never faster), parser (selectolax or beautifulsoup), skip_seen=true to drop postings an earlier scrape delivered (with ack_seen=true they only count as delivered once acked through POST /scrape/{scrape_id}/ack), and crawl_mode (incremental or full; incremental crawls need skip_seen, and with ack_seen their cursors only advance on the ack) with known_page_threshold and full_crawl_interval"
+    )
+
+class BatchScrapeRequest(ScrapeRequest):
+    sources: List[str] = Field(default=[], description="Scrapers to run; all of them when empty")
+    concurrency: int = Field(default=3, ge=1, description="Maximum number of sources scraped at once")
+    timeout: float = Field(default=120.0, gt=0, description="Per-source deadline in seconds")
+    source_timeouts: Dict[str, float] = Field(default={}, description="Deadline overrides per source")
 
 class ScrapeResult(BaseModel):
     jobs_scraped: int
@@ -34,6 +44,26 @@ class ScrapeResult(BaseModel):
     scraper_name: str
     timestamp: datetime = Field(default_factory=datetime.now)
 
+class ScrapeStatus(BaseModel):
+    scrape_id: str
+    scraper_name: str
+    status: str = Field(description="queued, running, completed, failed, timeout or cancelled")
+    jobs_scraped: int
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    duration: Optional[float] = None
+    results_spilled: bool = False
+
+class ScrapeResultsPage(BaseModel):
+    scrape_id: str
+    status: str
+    total: int
+    offset: int
+    limit: int
+    jobs: List[JobData]
+
 class HealthResponse(BaseModel):
     status: str
     timestamp: datetime
@@ -1,8 +1,11 @@
 from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi.responses import StreamingResponse
 from typing import List
+import asyncio
 import logging
+import time
 
-from .models import JobData, ScrapeRequest, ScrapeResult
+from .models import JobData, ScrapeRequest, ScrapeResult, BatchScrapeRequest
 from ..services.scraper import RemoteOKScraper, IndeedScraper, LinkedInScraper
 
 logger = logging.getLogger(__name__)
@@ -25,6 +28,70 @@ async def get_scrapers():
         ]
     }
 
+@router.post("/scrape/batch")
+async def scrape_batch(request: BatchScrapeRequest) -> dict:
+    """Scrape several sources concurrently, each under its own deadline
+    
+    A source that misses its deadline is reported as 'timeout' along with the
+    jobs it yielded before being cancelled; the other sources are unaffected.
+    """
+    names = request.sources or list(scrapers.keys())
+    unknown = [name for name in names if name not in scrapers]
+    if unknown:
+        raise HTTPException(status_code=404, detail=f"Scrapers not found: {unknown}")
+    
+    semaphore = asyncio.Semaphore(request.concurrency)
+    batch_started = time.perf_counter()
+    
+    async def run(scraper_name: str) -> dict:
+        scraper = scrapers[scraper_name]
+        timeout = request.source_timeouts.get(scraper_name, request.timeout)
+        jobs = []
+        
+        async def collect():
+            async for job in scraper.iter_jobs(
+                keywords=request.keywords,
+                location=request.location,
+                max_pages=request.max_pages,
+                config=request.job_board_config
+            ):
+                jobs.append(job.model_dump())
+        
+        async with semaphore:
+            started = time.perf_counter()
+            result = {
+                "status": "completed",
+                "queued_seconds": started - batch_started,
+            }
+            try:
+                await asyncio.wait_for(collect(), timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"Batch scraping for {scraper_name} timed out after {timeout}s")
+                result["status"] = "timeout"
+                result["error"] = f"Timed out after {timeout}s"
+            except Exception as e:
+                logger.error(f"Batch scraping error for {scraper_name}: {str(e)}")
+                result["status"] = "failed"
+                result["error"] = str(e)
+            
+            result.update({
+                "duration": time.perf_counter() - started,
+                "jobs_scraped": len(jobs),
+                "jobs_created": len(jobs),
+                "jobs_updated": 0,
+                "jobs": jobs,
+            })
+            return result
+    
+    outcomes = await asyncio.gather(*(run(name) for name in names))
+    results = dict(zip(names, outcomes))
+    
+    return {
+        "message": "Batch scraping completed",
+        "duration": time.perf_counter() - batch_started,
+        "results": results
+    }
+
 @router.post("/scrape/{scraper_name}")
 async def scrape_jobs(
     scraper_name: str,
@@ -41,11 +108,16 @@ async def scrape_jobs(
     
     # Run scraping
     try:
-        jobs = await scraper.scrape_jobs(
-            keywords=request.keywords,
-            location=request.location,
-            max_pages=request.max_pages
-        )
+        # Serialize as jobs arrive so only one copy of the results is held
+        jobs = [
+            job.model_dump()
+            async for job in scraper.iter_jobs(
+                keywords=request.keywords,
+                location=request.location,
+                max_pages=request.max_pages,
+                config=request.job_board_config
+            )
+        ]
         
         return {
             "jobs_scraped": len(jobs),
@@ -53,7 +125,7 @@ async def scrape_jobs(
             "jobs_updated": 0,
             "status": "completed",
             "scraper_name": scraper_name,
-            "jobs": [job.dict() for job in jobs]
+            "jobs": jobs
         }
     
     except Exception as e:
@@ -67,36 +139,27 @@ async def scrape_jobs(
             "scraper_name": scraper_name
         }
 
-@router.post("/scrape/batch")
-async def scrape_batch(request: ScrapeRequest) -> dict:
-    results = {}
+@router.post("/scrape/{scraper_name}/stream")
+async def stream_jobs(scraper_name: str, request: ScrapeRequest):
+    """Stream scraped jobs as NDJSON, one JobData object per line"""
+    if scraper_name not in scrapers:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Scraper '{scraper_name}' not found"
+        )
     
-    for scraper_name, scraper in scrapers.items():
+    scraper = scrapers[scraper_name]
+    
+    async def ndjson():
         try:
-            jobs = await scraper.scrape_jobs(
+            async for job in scraper.iter_jobs(
                 keywords=request.keywords,
                 location=request.location,
-                max_pages=request.max_pages
-            )
-            
-            results[scraper_name] = {
-                "jobs_scraped": len(jobs),
-                "jobs_created": len(jobs),
-                "jobs_updated": 0,
-                "status": "completed"
-            }
-            
+                max_pages=request.max_pages,
+                config=request.job_board_config
+            ):
+                yield job.model_dump_json() + "\n"
         except Exception as e:
-            logger.error(f"Batch scraping error for {scraper_name}: {str(e)}")
-            results[scraper_name] = {
-                "jobs_scraped": 0,
-                "jobs_created": 0,
-                "jobs_updated": 0,
-                "status": "failed",
-                "error": str(e)
-            }
+            logger.error(f"Streaming error for {scraper_name}: {str(e)}")
     
-    return {
-        "message": "Batch scraping completed",
-        "results": results
-    }
\ No newline at end of file
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
@@ -1,20 +1,47 @@
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
 import httpx
+import json
 import logging
 from datetime import datetime
 import asyncio
+from contextlib import asynccontextmanager
 
 from .services.scraper import RemoteOKScraper, IndeedScraper, LinkedInScraper
-from .api.models import JobData, ScrapeResult, ScrapeRequest
+from .services.http_pool import http_pool
+from .services.http_cache import http_cache
+from .services.parse_pool import parse_pool
+from .services.loop_monitor import loop_monitor
+from .services.dedup import seen_postings
+from .services.crawl_cursors import crawl_cursors
+from .services.registry import scrape_registry
+from .api.models import JobData, ScrapeResult, ScrapeRequest, BatchScrapeRequest, ScrapeStatus, ScrapeResultsPage
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Job Scraper API", version="1.0.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Scrapers borrow keep-alive clients from the shared pool; close them on shutdown
+    app.state.http_pool = http_pool
+    # HTML parsing runs in worker processes so /health and other scrapes aren't stalled
+    parse_pool.start()
+    app.state.parse_pool = parse_pool
+    loop_monitor.start()
+    app.state.scrape_registry = scrape_registry
+    yield
+    await scrape_registry.aclose()
+    await loop_monitor.stop()
+    parse_pool.shutdown()
+    await seen_postings.aclose()
+    await crawl_cursors.aclose()
+    await http_pool.aclose()
+
+app = FastAPI(title="Job Scraper API", version="1.0.0", lifespan=lifespan)
 
 # Add CORS middleware
 app.add_middleware(
@@ -40,6 +67,24 @@ async def root():
 async def health_check():
     return {"status": "healthy", "timestamp": datetime.now().isoformat()}
 
+@app.get("/http/stats")
+async def http_pool_stats():
+    """Connection pool usage per scraper source and conditional-GET cache counters"""
+    return {**http_pool.stats(), "cache": http_cache.stats() if http_cache is not None else None}
+
+@app.get("/scrape/registry/stats")
+async def scrape_registry_stats():
+    """Scrape runs held by the registry, by status"""
+    return scrape_registry.stats()
+
+@app.get("/metrics/event-loop")
+async def event_loop_metrics():
+    """Event-loop lag and parse pool usage"""
+    return {
+        "event_loop": loop_monitor.stats(),
+        "parse_pool": parse_pool.stats(),
+    }
+
 @app.get("/scrapers")
 async def get_available_scrapers():
     return {
@@ -47,32 +92,57 @@ async def get_available_scrapers():
         "count": len(scrapers)
     }
 
+@app.post("/scrape/batch")
+async def scrape_multiple_sources(request: BatchScrapeRequest):
+    """Scrape jobs from multiple sources concurrently, each under its own deadline
+    
+    Every source gets its own scrape_id; a source that misses its deadline ends
+    as 'timeout' with the jobs it scraped so far, without holding up the rest.
+    """
+    names = request.sources or list(scrapers.keys())
+    unknown = [name for name in names if name not in scrapers]
+    if unknown:
+        raise HTTPException(status_code=404, detail=f"Scrapers not found: {unknown}")
+    
+    semaphore = asyncio.Semaphore(request.concurrency)
+    results = {}
+    
+    for scraper_name in names:
+        try:
+            run = scrape_registry.submit(
+                scraper_name,
+                scrapers[scraper_name],
+                request,
+                timeout=request.source_timeouts.get(scraper_name, request.timeout),
+                semaphore=semaphore
+            )
+            results[scraper_name] = {"status": run.status, "scrape_id": run.id}
+        except Exception as e:
+            results[scraper_name] = {"status": "failed", "error": str(e)}
+    
+    return {
+        "message": "Batch scraping initiated",
+        "results": results,
+        "keywords": request.keywords,
+        "location": request.location
+    }
+
 @app.post("/scrape/{scraper_name}")
-async def scrape_jobs(
-    scraper_name: str,
-    request: ScrapeRequest,
-    background_tasks: BackgroundTasks
-):
+async def scrape_jobs(scraper_name: str, request: ScrapeRequest):
+    """Start a scrape in the background; poll GET /scrape/{scrape_id} for its status and results"""
     if scraper_name not in scrapers:
         raise HTTPException(
             status_code=404,
             detail=f"Scraper '{scraper_name}' not found. Available scrapers: {list(scrapers.keys())}"
         )
     
-    scraper = scrapers[scraper_name]
-    
     try:
-        # Run scraping in background
-        background_tasks.add_task(
-            run_scraper,
-            scraper,
-            request.keywords,
-            request.location,
-            request.max_pages
-        )
+        run = scrape_registry.submit(scraper_name, scrapers[scraper_name], request, timeout=request.timeout)
         
         return {
             "message": f"Scraping started for {scraper_name}",
+            "scrape_id": run.id,
+            "status": run.status,
             "scraper": scraper_name,
             "keywords": request.keywords,
             "location": request.location,
@@ -83,60 +153,78 @@ async def scrape_jobs(
         logger.error(f"Error initiating scraping for {scraper_name}: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
-async def run_scraper(scraper, keywords: List[str], location: str, max_pages: int):
-    """Run scraper in background"""
-    try:
-        jobs = await scraper.scrape_jobs(keywords, location, max_pages)
-        
-        # Here you would typically save to database
-        # For now, we'll just log the results
-        logger.info(f"Scraped {len(jobs)} jobs successfully")
-        
-        return {
-            "jobs_scraped": len(jobs),
-            "jobs_created": len(jobs),  # Placeholder
-            "jobs_updated": 0,  # Placeholder
-            "status": "completed"
-        }
-        
-    except Exception as e:
-        logger.error(f"Error in scraper: {str(e)}")
-        return {
-            "jobs_scraped": 0,
-            "jobs_created": 0,
-            "jobs_updated": 0,
-            "status": "failed",
-            "error": str(e)
-        }
+def get_scrape_run(scrape_id: str):
+    run = scrape_registry.get(scrape_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail=f"Scrape '{scrape_id}' not found or its results have expired")
+    return run
 
-@app.post("/scrape/batch")
-async def scrape_multiple_sources(
-    request: ScrapeRequest,
-    background_tasks: BackgroundTasks
+@app.get("/scrape/{scrape_id}", response_model=ScrapeStatus)
+async def get_scrape_status(scrape_id: str):
+    """Status and progress of a scrape started with POST /scrape/{scraper_name}"""
+    return get_scrape_run(scrape_id).summary()
+
+@app.get("/scrape/{scrape_id}/results", response_model=ScrapeResultsPage)
+async def get_scrape_results(
+    scrape_id: str,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000)
 ):
-    """Scrape jobs from multiple sources"""
-    results = {}
-    
-    for scraper_name, scraper in scrapers.items():
-        try:
-            background_tasks.add_task(
-                run_scraper,
-                scraper,
-                request.keywords,
-                request.location,
-                request.max_pages
-            )
-            results[scraper_name] = "started"
-        except Exception as e:
-            results[scraper_name] = f"failed: {str(e)}"
-    
+    """One page of a scrape's jobs; results are available while the scrape is still running"""
+    run = get_scrape_run(scrape_id)
     return {
-        "message": "Batch scraping initiated",
-        "results": results,
-        "keywords": request.keywords,
-        "location": request.location
+        "scrape_id": run.id,
+        "status": run.status,
+        "total": len(run.results),
+        "offset": offset,
+        "limit": limit,
+        "jobs": [json.loads(line) for line in run.results.page(offset, limit)],
     }
 
+@app.post("/scrape/{scrape_id}/ack")
+async def ack_scrape_results(scrape_id: str):
+    """Mark a finished scrape's postings as seen, for scrapes run with skip_seen and ack_seen"""
+    run = get_scrape_run(scrape_id)
+    if not run.finished:
+        raise HTTPException(status_code=409, detail=f"Scrape '{scrape_id}' is still {run.status}")
+    acked = await scrape_registry.ack(run)
+    await seen_postings.flush()
+    return {"scrape_id": run.id, "acked": acked}
+
+@app.get("/scrape/{scrape_id}/results/stream")
+async def stream_scrape_results(scrape_id: str):
+    """All of a scrape's jobs as NDJSON, following the scrape until it finishes"""
+    run = get_scrape_run(scrape_id)
+    
+    async def ndjson():
+        async for line in scrape_registry.iter_results(run):
+            yield line + "\n"
+    
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+@app.post("/scrape/{scraper_name}/stream")
+async def stream_jobs(scraper_name: str, request: ScrapeRequest):
+    """Stream scraped jobs as NDJSON, one JobData object per line, while the crawl runs"""
+    if scraper_name not in scrapers:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Scraper '{scraper_name}' not found. Available scrapers: {list(scrapers.keys())}"
+        )
+    
+    return StreamingResponse(
+        stream_ndjson(scrapers[scraper_name], request),
+        media_type="application/x-ndjson"
+    )
+
+async def stream_ndjson(scraper, request: ScrapeRequest):
+    try:
+        async for job in scraper.iter_jobs(request.keywords, request.location, request.max_pages,
+                                           request.job_board_config):
+            yield job.model_dump_json() + "\n"
+    except Exception as e:
+        # Headers are already sent, so the best we can do is log and end the stream
+        logger.error(f"Error streaming {scraper.name}: {str(e)}")
+
 @app.get("/jobs/test")
 async def test_scraper():
     """Test endpoint to verify scraper functionality"""
@@ -0,0 +1,110 @@
+import asyncio
+import json
+import logging
+import os
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+class CrawlCursorStore:
+    """Per-source, per-query crawl cursors, optionally persisted to a JSON file
+
+    A cursor records the newest posting seen by the last crawl of a query and
+    when that query was last crawled in full.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.cursors: Dict[str, Dict[str, Any]] = self._load(path)
+        self.dirty = False
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    def _load(path: Optional[str]) -> Dict[str, Dict[str, Any]]:
+        if not path or not os.path.exists(path):
+            return {}
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.error(f"Ignoring unreadable crawl cursor file {path}: {str(e)}")
+            return {}
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return self.cursors.get(key)
+
+    async def set(self, key: str, cursor: Dict[str, Any]):
+        self.cursors[key] = cursor
+        self.dirty = True
+        await self.flush()
+
+    async def flush(self):
+        if not self.path or not self.dirty:
+            return
+        async with self._lock:
+            payload = json.dumps(self.cursors)
+            self.dirty = False
+            await asyncio.to_thread(self._write, payload)
+
+    def _write(self, payload: str):
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w') as f:
+            f.write(payload)
+        os.replace(tmp_path, self.path)
+
+    async def aclose(self):
+        await self.flush()
+
+class RedisCrawlCursorStore:
+    """Crawl cursors shared by every scraper process, stored in a Redis hash"""
+
+    def __init__(self, url: str, key: str = 'scraper:crawl_cursors'):
+        import redis.asyncio as redis
+
+        self.redis = redis.from_url(url)
+        self.key = key
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        value = await self.redis.hget(self.key, key)
+        return json.loads(value) if value else None
+
+    async def set(self, key: str, cursor: Dict[str, Any]):
+        await self.redis.hset(self.key, key, json.dumps(cursor))
+
+    async def flush(self):
+        pass
+
+    async def aclose(self):
+        await self.redis.aclose()
+
+def crawl_cursors_from_env():
+    """SCRAPER_CURSOR_REDIS_URL (or SCRAPER_SEEN_REDIS_URL) shares cursors through Redis;
+    otherwise SCRAPER_CURSOR_PATH persists them to disk"""
+    redis_url = os.getenv('SCRAPER_CURSOR_REDIS_URL') or os.getenv('SCRAPER_SEEN_REDIS_URL')
+    if redis_url:
+        return RedisCrawlCursorStore(redis_url)
+    return CrawlCursorStore(path=os.getenv('SCRAPER_CURSOR_PATH'))
+
+crawl_cursors = crawl_cursors_from_env()
+
+class PendingCursors:
+    """Cursor updates of ack_seen scrapes, held by scrape id until the client acks its results
+
+    Advancing a cursor before the results are stored would make the next
+    incremental crawl stop short of postings that were never ingested.
+    """
+
+    def __init__(self):
+        self.updates: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+    def stage(self, scrape_id: str, key: str, cursor: Dict[str, Any]):
+        self.updates.setdefault(scrape_id, {})[key] = cursor
+
+    async def commit(self, scrape_id: str):
+        for key, cursor in self.updates.pop(scrape_id, {}).items():
+            await crawl_cursors.set(key, cursor)
+
+    def discard(self, scrape_id: str):
+        self.updates.pop(scrape_id, None)
+
+pending_cursors = PendingCursors()
@@ -0,0 +1,332 @@
+import asyncio
+import hashlib
+import logging
+import math
+import os
+import struct
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from ..api.models import JobData
+
+logger = logging.getLogger(__name__)
+
+# Query parameters that only track the click, so the same posting can show up
+# under many URLs. utm_* parameters are stripped by prefix.
+TRACKING_PARAMS = {
+    'trk', 'trackingid', 'refid', 'ref', 'src', 'from', 'position', 'pagenum',
+    'fbclid', 'gclid', 'msclkid', 'tk', 'vjs', 'advn', 'adid', 'sjdu', 'xkcb',
+    'camk', 'originalsubdomain',
+}
+
+def normalize_job_url(url: str) -> str:
+    """Canonical form of a posting URL: lowercase host, no tracking parameters or fragment"""
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith('utm_')
+    )
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((parts.scheme.lower() or 'https', host, path, urlencode(query), ''))
+
+def stable_external_id(source: str, url: str) -> str:
+    """Digest-based external_id that is the same across processes and restarts"""
+    digest = hashlib.blake2b(normalize_job_url(url).encode('utf-8'), digest_size=10).hexdigest()
+    return f"{source}_{digest}"
+
+def seen_key(job: JobData) -> str:
+    """Seen-set key of a posting: its external_id and a digest of its content,
+    so an edited posting counts as unseen and is delivered again"""
+    # HTML scrapers stamp posted_date with the scrape time, so it is left out
+    content = job.model_dump_json(exclude={'posted_date'})
+    digest = hashlib.blake2b(content.encode('utf-8'), digest_size=8).hexdigest()
+    return f"{job.external_id}:{digest}"
+
+def bloom_parameters(capacity: int, error_rate: float) -> Tuple[int, int]:
+    """Bit count and hash count for a Bloom filter holding `capacity` keys at `error_rate`"""
+    bits = math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+    hashes = max(1, round(bits / capacity * math.log(2)))
+    return bits, hashes
+
+def bloom_positions(key: str, bits: int, hashes: int) -> List[int]:
+    digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+    h1, h2 = struct.unpack('<QQ', digest)
+    return [(h1 + i * h2) % bits for i in range(hashes)]
+
+class BloomFilter:
+    """In-memory Bloom filter over a bytearray
+
+    created_at and count (keys newly added) tell SeenPostings when to rotate it.
+    """
+    MAGIC = b'BLM2'
+    LEGACY_MAGIC = b'BLM1'
+
+    def __init__(self, bits: int, hashes: int, data: Optional[bytearray] = None,
+                 created_at: Optional[float] = None, count: int = 0):
+        self.bits = bits
+        self.hashes = hashes
+        self.data = data if data is not None else bytearray((bits + 7) // 8)
+        self.created_at = created_at if created_at is not None else time.time()
+        self.count = count
+
+    def add(self, key: str) -> bool:
+        """Add key; return True if it was not (probably) present before"""
+        new = False
+        for position in bloom_positions(key, self.bits, self.hashes):
+            byte, mask = position >> 3, 1 << (position & 7)
+            if not self.data[byte] & mask:
+                self.data[byte] |= mask
+                new = True
+        self.count += new
+        return new
+
+    def __contains__(self, key: str) -> bool:
+        return all(
+            self.data[position >> 3] & (1 << (position & 7))
+            for position in bloom_positions(key, self.bits, self.hashes)
+        )
+
+    def to_bytes(self) -> bytes:
+        return self.MAGIC + struct.pack('<QIdQ', self.bits, self.hashes, self.created_at, self.count) + bytes(self.data)
+
+    @classmethod
+    def from_bytes(cls, payload: bytes) -> 'BloomFilter':
+        if payload[:4] == cls.LEGACY_MAGIC:
+            bits, hashes = struct.unpack('<QI', payload[4:16])
+            return cls(bits, hashes, bytearray(payload[16:]))
+        if payload[:4] != cls.MAGIC:
+            raise ValueError("Not a Bloom filter file")
+        bits, hashes, created_at, count = struct.unpack('<QIdQ', payload[4:32])
+        return cls(bits, hashes, bytearray(payload[32:]), created_at, count)
+
+class SeenPostings:
+    """Process-local seen-set, optionally persisted to a file between restarts
+
+    Keys are kept in `generations` Bloom filters. New keys go into the newest
+    one, which is rotated out for a fresh filter once it is ttl / generations
+    seconds old or holds `capacity` keys, and the oldest filter is dropped. A
+    posting is therefore forgotten between ttl - ttl / generations and ttl
+    seconds after it was marked, and the false-positive rate stays at
+    error_rate however long the service runs. ttl=None only rotates on capacity.
+    """
+    MAGIC = b'BLG1'
+
+    def __init__(self, capacity: int = 1000000, error_rate: float = 0.001, path: Optional[str] = None,
+                 ttl: Optional[float] = None, generations: int = 2):
+        self.path = path
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.max_generations = max(1, generations)
+        self.span = ttl / self.max_generations if ttl else None
+        # Newest first
+        self.filters: List[BloomFilter] = self._load(path) or []
+        self.dirty = False
+        self.checked = 0
+        self.skipped = 0
+        self.rotations = 0
+        self._lock = asyncio.Lock()
+        if not self.filters:
+            self._rotate()
+
+    @classmethod
+    def _load(cls, path: Optional[str]) -> Optional[List[BloomFilter]]:
+        if not path or not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'rb') as f:
+                payload = f.read()
+            if payload[:4] != cls.MAGIC:
+                # A single filter written before generations were added
+                return [BloomFilter.from_bytes(payload)]
+            count, = struct.unpack('<I', payload[4:8])
+            filters, offset = [], 8
+            for _ in range(count):
+                size, = struct.unpack('<Q', payload[offset:offset + 8])
+                filters.append(BloomFilter.from_bytes(payload[offset + 8:offset + 8 + size]))
+                offset += 8 + size
+            return filters
+        except (OSError, ValueError, struct.error) as e:
+            logger.error(f"Ignoring unreadable seen-postings file {path}: {str(e)}")
+            return None
+
+    def _rotate(self):
+        self.filters.insert(0, BloomFilter(*bloom_parameters(self.capacity, self.error_rate)))
+        del self.filters[self.max_generations:]
+        self.rotations += 1
+        self.dirty = True
+
+    def _current(self) -> BloomFilter:
+        current = self.filters[0]
+        expired = self.span is not None and time.time() - current.created_at >= self.span
+        if expired or current.count >= self.capacity:
+            self._rotate()
+        return self.filters[0]
+
+    async def contains_many(self, keys: Iterable[str]) -> List[bool]:
+        """True for each key that is (probably) seen; nothing is marked"""
+        seen = [any(key in bloom for bloom in self.filters) for key in keys]
+        self.checked += len(seen)
+        self.skipped += sum(seen)
+        return seen
+
+    async def add_many(self, keys: Iterable[str]) -> List[bool]:
+        """Mark keys as seen; return True for each key that had not been seen before"""
+        current = self._current()
+        new = []
+        for key in keys:
+            seen = any(key in bloom for bloom in self.filters[1:])
+            new.append(current.add(key) and not seen)
+        self.dirty = self.dirty or any(new)
+        return new
+
+    async def flush(self):
+        if not self.path or not self.dirty:
+            return
+        async with self._lock:
+            payload = self.MAGIC + struct.pack('<I', len(self.filters))
+            for bloom in self.filters:
+                data = bloom.to_bytes()
+                payload += struct.pack('<Q', len(data)) + data
+            self.dirty = False
+            await asyncio.to_thread(self._write, payload)
+
+    def _write(self, payload: bytes):
+        # Write then rename so a crash never leaves a truncated filter behind
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, self.path)
+
+    async def aclose(self):
+        await self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'backend': 'file' if self.path else 'memory',
+            'bits': self.filters[0].bits,
+            'hashes': self.filters[0].hashes,
+            'generations': len(self.filters),
+            'generation_seconds': self.span,
+            'rotations': self.rotations,
+            'checked': self.checked,
+            'skipped': self.skipped,
+        }
+
+class RedisSeenPostings:
+    """Seen-set shared by every scraper process, stored as Bloom filters in Redis bitmaps
+
+    With a ttl, each ttl / generations window of time gets its own bitmap key,
+    which Redis expires once the window is ttl seconds old; lookups check the
+    last `generations` windows.
+    """
+
+    def __init__(self, url: str, key: str = 'scraper:seen_postings', capacity: int = 1000000,
+                 error_rate: float = 0.001, ttl: Optional[float] = None, generations: int = 2):
+        import redis.asyncio as redis
+
+        self.redis = redis.from_url(url)
+        self.key = key
+        self.bits, self.hashes = bloom_parameters(capacity, error_rate)
+        self.generations = max(1, generations)
+        self.span = ttl / self.generations if ttl else None
+        self.checked = 0
+        self.skipped = 0
+
+    def _keys(self) -> List[str]:
+        """Bitmap keys of the live generations, newest first"""
+        if self.span is None:
+            return [self.key]
+        window = int(time.time() // self.span)
+        return [f"{self.key}:{window - i}" for i in range(self.generations)]
+
+    async def _get_bits(self, keys: List[str], bitmaps: List[str]) -> List[bool]:
+        """True for each key whose bits are all set in any of `bitmaps`"""
+        pipeline = self.redis.pipeline(transaction=False)
+        for key in keys:
+            for bitmap in bitmaps:
+                for position in bloom_positions(key, self.bits, self.hashes):
+                    pipeline.getbit(bitmap, position)
+        bits = await pipeline.execute()
+
+        per_key = len(bitmaps) * self.hashes
+        return [
+            any(
+                all(bits[i * per_key + j * self.hashes:i * per_key + (j + 1) * self.hashes])
+                for j in range(len(bitmaps))
+            )
+            for i in range(len(keys))
+        ]
+
+    async def contains_many(self, keys: Iterable[str]) -> List[bool]:
+        """True for each key that is (probably) seen; nothing is marked"""
+        keys = list(keys)
+        if not keys:
+            return []
+        seen = await self._get_bits(keys, self._keys())
+        self.checked += len(seen)
+        self.skipped += sum(seen)
+        return seen
+
+    async def add_many(self, keys: Iterable[str]) -> List[bool]:
+        """Mark keys as seen; return True for each key that had not been seen before"""
+        keys = list(keys)
+        if not keys:
+            return []
+
+        bitmaps = self._keys()
+        seen_before = await self._get_bits(keys, bitmaps[1:]) if len(bitmaps) > 1 else [False] * len(keys)
+
+        pipeline = self.redis.pipeline(transaction=False)
+        for key in keys:
+            for position in bloom_positions(key, self.bits, self.hashes):
+                pipeline.setbit(bitmaps[0], position, 1)
+        if self.span is not None:
+            pipeline.expire(bitmaps[0], int(self.span * self.generations))
+        previous = await pipeline.execute()
+
+        # SETBIT returns the old bit, so a key is new if any of its bits was unset
+        return [
+            not all(previous[i * self.hashes:(i + 1) * self.hashes]) and not seen_before[i]
+            for i in range(len(keys))
+        ]
+
+    async def flush(self):
+        pass
+
+    async def aclose(self):
+        await self.redis.aclose()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'backend': 'redis',
+            'bits': self.bits,
+            'hashes': self.hashes,
+            'generations': self.generations,
+            'generation_seconds': self.span,
+            'checked': self.checked,
+            'skipped': self.skipped,
+        }
+
+def seen_postings_from_env():
+    """SCRAPER_SEEN_REDIS_URL shares the set through Redis; otherwise SCRAPER_SEEN_PATH persists it to disk
+
+    Postings are forgotten after SCRAPER_SEEN_TTL_HOURS (0 keeps them until the
+    filter fills up), so a posting that is still listed is re-emitted now and then.
+    """
+    capacity = int(os.getenv('SCRAPER_SEEN_CAPACITY', '1000000'))
+    error_rate = float(os.getenv('SCRAPER_SEEN_ERROR_RATE', '0.001'))
+    ttl = float(os.getenv('SCRAPER_SEEN_TTL_HOURS', '720')) * 3600 or None
+    generations = int(os.getenv('SCRAPER_SEEN_GENERATIONS', '2'))
+    redis_url = os.getenv('SCRAPER_SEEN_REDIS_URL')
+    if redis_url:
+        return RedisSeenPostings(redis_url, capacity=capacity, error_rate=error_rate, ttl=ttl,
+                                 generations=generations)
+    return SeenPostings(capacity=capacity, error_rate=error_rate, path=os.getenv('SCRAPER_SEEN_PATH'),
+                        ttl=ttl, generations=generations)
+
+seen_postings = seen_postings_from_env()
@@ -0,0 +1,175 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+class NotModified(bytes):
+    """Cached body returned when the server answered 304 Not Modified
+
+    Callers that only care about new content can skip it with isinstance();
+    the bytes are still there for callers that want to re-parse everything.
+    """
+
+class HTTPCache:
+    """Size-bounded on-disk cache of validated responses for conditional GETs
+
+    Only responses carrying an ETag or Last-Modified header are stored. Each
+    entry is a body file plus a JSON metadata file named after the URL's
+    digest. Least recently used entries are evicted once the bodies exceed
+    max_bytes.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 256 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.entries: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self.size = 0
+        self.requests = 0
+        self.not_modified = 0
+        self.stored = 0
+        self.evicted = 0
+        self._loaded = False
+
+    @classmethod
+    def from_env(cls) -> Optional['HTTPCache']:
+        """Build a cache from SCRAPER_HTTP_CACHE_* variables; SCRAPER_HTTP_CACHE=false disables it"""
+        if os.getenv('SCRAPER_HTTP_CACHE', 'true').lower() not in ('1', 'true', 'yes'):
+            return None
+        return cls(
+            directory=os.getenv('SCRAPER_HTTP_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'scraper-http-cache')),
+            max_bytes=int(os.getenv('SCRAPER_HTTP_CACHE_MAX_BYTES', str(256 * 1024 * 1024))),
+        )
+
+    def _path(self, key: str, suffix: str) -> str:
+        return os.path.join(self.directory, f"{key}.{suffix}")
+
+    def _load_index(self):
+        # Loaded on first use, so parse workers importing this module never scan the directory.
+        # LRU order is rebuilt from the metadata files' mtimes, which are touched on every hit.
+        self._loaded = True
+        os.makedirs(self.directory, exist_ok=True)
+        entries = []
+        for filename in os.listdir(self.directory):
+            if not filename.endswith('.json'):
+                continue
+            path = os.path.join(self.directory, filename)
+            try:
+                with open(path) as f:
+                    meta = json.load(f)
+                entries.append((os.path.getmtime(path), filename[:-len('.json')], meta))
+            except (OSError, ValueError):
+                continue
+        for _, key, meta in sorted(entries, key=lambda entry: entry[0]):
+            self.entries[key] = meta
+            self.size += meta['size']
+        self._evict()
+
+    def _key(self, url: str) -> str:
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+    async def get(self, client: httpx.AsyncClient, url: str, **kwargs) -> bytes:
+        """GET url with If-None-Match / If-Modified-Since from the cached entry
+
+        Returns the body, or the cached body as NotModified on a 304. Raises
+        httpx.HTTPStatusError for error responses, like raise_for_status().
+        """
+        if not self._loaded:
+            self._load_index()
+        self.requests += 1
+        key = self._key(url)
+        meta = self.entries.get(key)
+
+        headers = dict(kwargs.pop('headers', None) or {})
+        if meta is not None:
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+
+        response = await client.get(url, headers=headers, **kwargs)
+
+        if response.status_code == 304 and meta is not None:
+            body = await asyncio.to_thread(self._read, key)
+            if body is not None:
+                self.not_modified += 1
+                self.entries.move_to_end(key)
+                return NotModified(body)
+            # The body file vanished; retry unconditionally
+            self._drop(key)
+            return await self.get(client, url, **kwargs)
+
+        response.raise_for_status()
+        body = response.content
+
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if (etag or last_modified) and len(body) <= self.max_bytes:
+            await self._store(key, url, body, etag, last_modified)
+        elif meta is not None:
+            self._drop(key)
+        return body
+
+    def _read(self, key: str) -> Optional[bytes]:
+        try:
+            with open(self._path(key, 'body'), 'rb') as f:
+                body = f.read()
+            os.utime(self._path(key, 'json'))
+            return body
+        except OSError:
+            return None
+
+    async def _store(self, key: str, url: str, body: bytes, etag: Optional[str], last_modified: Optional[str]):
+        meta = {'url': url, 'etag': etag, 'last_modified': last_modified, 'size': len(body)}
+        await asyncio.to_thread(self._write, key, body, meta)
+
+        previous = self.entries.pop(key, None)
+        if previous is not None:
+            self.size -= previous['size']
+        self.entries[key] = meta
+        self.size += meta['size']
+        self.stored += 1
+        self._evict()
+
+    def _write(self, key: str, body: bytes, meta: Dict[str, Any]):
+        for suffix, payload in (('body', body), ('json', json.dumps(meta).encode('utf-8'))):
+            tmp_path = self._path(key, f"{suffix}.tmp")
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, self._path(key, suffix))
+
+    def _evict(self):
+        while self.size > self.max_bytes and self.entries:
+            key = next(iter(self.entries))
+            self._drop(key)
+            self.evicted += 1
+
+    def _drop(self, key: str):
+        meta = self.entries.pop(key, None)
+        if meta is not None:
+            self.size -= meta['size']
+        for suffix in ('json', 'body'):
+            try:
+                os.remove(self._path(key, suffix))
+            except OSError:
+                pass
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'entries': len(self.entries),
+            'bytes': self.size,
+            'max_bytes': self.max_bytes,
+            'requests': self.requests,
+            'not_modified': self.not_modified,
+            'stored': self.stored,
+            'evicted': self.evicted,
+        }
+
+http_cache = HTTPCache.from_env()
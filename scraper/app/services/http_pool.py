@@ -0,0 +1,129 @@
+import os
+import logging
+import weakref
+from typing import Dict, Any, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+class _ClientStats:
+    """Request and connection counters for one pooled client"""
+
+    def __init__(self):
+        self.requests = 0
+        self.new_connections = 0
+        self._seen_connections = weakref.WeakSet()
+
+    def record(self, client: httpx.AsyncClient):
+        self.requests += 1
+        for connection in _pool_connections(client):
+            if connection not in self._seen_connections:
+                self._seen_connections.add(connection)
+                self.new_connections += 1
+
+def _pool_connections(client: httpx.AsyncClient) -> list:
+    # httpx does not expose its connection pool publicly; degrade to no stats if that changes
+    pool = getattr(client._transport, '_pool', None)
+    return list(getattr(pool, 'connections', []))
+
+class HTTPClientPool:
+    """Process-wide pool of keep-alive httpx clients, one per scraper source
+
+    Each source gets its own AsyncClient, so the connection limits apply per
+    host and connections are reused across scrape runs. The FastAPI app
+    lifespan closes the pool on shutdown.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 5,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+        timeout: float = 30.0,
+        source_timeouts: Optional[Dict[str, float]] = None,
+    ):
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2
+        self.timeout = timeout
+        self.source_timeouts = source_timeouts or {}
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._stats: Dict[str, _ClientStats] = {}
+
+    @classmethod
+    def from_env(cls) -> 'HTTPClientPool':
+        """Build a pool from SCRAPER_HTTP_* environment variables
+
+        Per-source timeouts are read from SCRAPER_HTTP_TIMEOUT_<SOURCE>,
+        e.g. SCRAPER_HTTP_TIMEOUT_LINKEDIN=60.
+        """
+        prefix = 'SCRAPER_HTTP_TIMEOUT_'
+        source_timeouts = {
+            name[len(prefix):].lower(): float(value)
+            for name, value in os.environ.items()
+            if name.startswith(prefix)
+        }
+        return cls(
+            max_connections=int(os.getenv('SCRAPER_HTTP_MAX_CONNECTIONS', '10')),
+            max_keepalive_connections=int(os.getenv('SCRAPER_HTTP_MAX_KEEPALIVE', '5')),
+            keepalive_expiry=float(os.getenv('SCRAPER_HTTP_KEEPALIVE_EXPIRY', '30')),
+            http2=os.getenv('SCRAPER_HTTP2', 'false').lower() in ('1', 'true', 'yes'),
+            timeout=float(os.getenv('SCRAPER_HTTP_TIMEOUT', '30')),
+            source_timeouts=source_timeouts,
+        )
+
+    def client(self, source: str) -> httpx.AsyncClient:
+        """Borrow the shared client for a source, creating it on first use"""
+        client = self._clients.get(source)
+        if client is None or client.is_closed:
+            stats = self._stats.setdefault(source, _ClientStats())
+
+            async def on_response(response: httpx.Response):
+                stats.record(client)
+
+            client = httpx.AsyncClient(
+                timeout=self.source_timeouts.get(source, self.timeout),
+                limits=self.limits,
+                http2=self.http2,
+                headers=DEFAULT_HEADERS,
+                event_hooks={'response': [on_response]},
+            )
+            self._clients[source] = client
+        return client
+
+    async def aclose(self):
+        for client in self._clients.values():
+            await client.aclose()
+        self._clients.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        sources = {}
+        for source, client in self._clients.items():
+            stats = self._stats[source]
+            connections = _pool_connections(client)
+            sources[source] = {
+                'open_connections': len(connections),
+                'idle_connections': sum(1 for connection in connections if connection.is_idle()),
+                'requests': stats.requests,
+                'new_connections': stats.new_connections,
+                'reuse_rate': 1 - stats.new_connections / stats.requests if stats.requests else None,
+                'timeout': self.source_timeouts.get(source, self.timeout),
+            }
+        return {
+            'http2': self.http2,
+            'max_connections_per_host': self.limits.max_connections,
+            'max_keepalive_connections': self.limits.max_keepalive_connections,
+            'keepalive_expiry': self.limits.keepalive_expiry,
+            'sources': sources,
+        }
+
+http_pool = HTTPClientPool.from_env()
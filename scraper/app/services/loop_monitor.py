@@ -0,0 +1,67 @@
+import asyncio
+import os
+from collections import deque
+from typing import Any, Dict, Optional
+
+class EventLoopLagMonitor:
+    """Measures how late the event loop wakes up from a fixed-interval sleep
+
+    Anything that blocks the loop (e.g. parsing a page inline) shows up as lag,
+    so /health staying responsive under load can be confirmed from the numbers.
+    """
+
+    def __init__(self, interval: float = 0.1, window: int = 600):
+        self.interval = interval
+        self.samples = deque(maxlen=window)
+        self.max_lag = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def from_env(cls) -> 'EventLoopLagMonitor':
+        return cls(
+            interval=float(os.getenv('SCRAPER_LOOP_LAG_INTERVAL', '0.1')),
+            window=int(os.getenv('SCRAPER_LOOP_LAG_WINDOW', '600')),
+        )
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - expected)
+            self.samples.append(lag)
+            self.max_lag = max(self.max_lag, lag)
+
+    def stats(self) -> Dict[str, Any]:
+        samples = sorted(self.samples)
+
+        def percentile(fraction: float) -> Optional[float]:
+            if not samples:
+                return None
+            return samples[min(len(samples) - 1, int(len(samples) * fraction))]
+
+        return {
+            'interval_seconds': self.interval,
+            'samples': len(samples),
+            'current_lag_seconds': self.samples[-1] if self.samples else None,
+            'mean_lag_seconds': sum(samples) / len(samples) if samples else None,
+            'p95_lag_seconds': percentile(0.95),
+            'p99_lag_seconds': percentile(0.99),
+            'window_max_lag_seconds': samples[-1] if samples else None,
+            'max_lag_seconds': self.max_lag,
+        }
+
+loop_monitor = EventLoopLagMonitor.from_env()
@@ -0,0 +1,72 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+class ParsePool:
+    """Bounded process pool that keeps CPU-bound page parsing off the event loop
+
+    Workers are spawned rather than forked, so they don't inherit the running
+    event loop or open sockets. The FastAPI app lifespan starts the pool and
+    shuts it down; with max_workers=0 parsing runs inline on the loop.
+    """
+
+    def __init__(self, max_workers: int = 2):
+        self.max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self.submitted = 0
+        self.in_flight = 0
+        self.failures = 0
+
+    @classmethod
+    def from_env(cls) -> 'ParsePool':
+        """Build a pool from SCRAPER_PARSE_WORKERS (defaults to min(4, CPU count))"""
+        default_workers = min(4, os.cpu_count() or 1)
+        return cls(max_workers=int(os.getenv('SCRAPER_PARSE_WORKERS', str(default_workers))))
+
+    def start(self):
+        if self._executor is None and self.max_workers > 0:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context('spawn'),
+            )
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    async def run(self, func: Callable, *args) -> Any:
+        """Run func(*args) in a worker process; func and args must be picklable"""
+        if self.max_workers <= 0:
+            return func(*args)
+
+        self.start()
+        self.submitted += 1
+        self.in_flight += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM-killed); replace the pool so later pages can still be parsed
+            self.failures += 1
+            logger.error("Parse worker died, restarting the parse pool")
+            self._executor = None
+            raise
+        finally:
+            self.in_flight -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'max_workers': self.max_workers,
+            'running': self._executor is not None,
+            'submitted': self.submitted,
+            'in_flight': self.in_flight,
+            'failures': self.failures,
+        }
+
+parse_pool = ParsePool.from_env()
@@ -0,0 +1,99 @@
+import asyncio
+import json
+import os
+import time
+from typing import Dict, Optional
+
+class TokenBucket:
+    """Async token bucket: `rate` requests per second with bursts up to `burst`
+
+    Waiters are served in arrival order, so overlapping scrapes of one host
+    share the budget fairly instead of each assuming they own it.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive, got {rate}")
+        if burst < 1:
+            raise ValueError(f"Burst must be at least 1, got {burst}")
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+class RequestRateLimit:
+    """Rate limit of one scrape: the host's shared bucket, and optionally a slower bucket of its own"""
+
+    def __init__(self, host_bucket: TokenBucket, own_bucket: Optional[TokenBucket] = None):
+        self.host_bucket = host_bucket
+        self.own_bucket = own_bucket
+
+    async def acquire(self):
+        if self.own_bucket is not None:
+            await self.own_bucket.acquire()
+        await self.host_bucket.acquire()
+
+class RateLimiterRegistry:
+    """Process-wide token buckets keyed by host
+
+    A host's limit is fixed when its bucket is created: from SCRAPER_RATE_LIMITS
+    if the host is listed there, else from the defaults of the scraper that
+    first uses it. Requests can slow themselves down below the host's limit,
+    but never change it.
+    """
+
+    def __init__(self, default_rate: float = 1.0, default_burst: int = 1,
+                 host_limits: Optional[Dict[str, Dict[str, float]]] = None):
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self.host_limits = host_limits or {}
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    @classmethod
+    def from_env(cls) -> 'RateLimiterRegistry':
+        """SCRAPER_RATE_LIMITS is JSON such as {"indeed.com": {"requests_per_second": 0.5, "burst": 1}}"""
+        return cls(host_limits=json.loads(os.getenv('SCRAPER_RATE_LIMITS', '{}')))
+
+    def get(self, host: str, rate: Optional[float] = None, burst: Optional[int] = None) -> TokenBucket:
+        """The host's shared bucket; rate and burst are only used if it doesn't exist yet"""
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            limits = self.host_limits.get(host, {})
+            bucket = self._buckets[host] = TokenBucket(
+                float(limits.get('requests_per_second', rate or self.default_rate)),
+                int(limits.get('burst', burst or self.default_burst)),
+            )
+        return bucket
+
+    def for_request(self, host_bucket: TokenBucket, rate: Optional[float] = None,
+                    burst: Optional[int] = None) -> RequestRateLimit:
+        """Limit for one scrape that asked for `rate` / `burst`; only values below the host's apply"""
+        if rate is not None and rate <= 0:
+            raise ValueError(f"requests_per_second must be positive, got {rate}")
+        if burst is not None and burst < 1:
+            raise ValueError(f"burst must be at least 1, got {burst}")
+
+        if (rate is None or rate >= host_bucket.rate) and (burst is None or burst >= host_bucket.burst):
+            return RequestRateLimit(host_bucket)
+        own_bucket = TokenBucket(
+            min(rate or host_bucket.rate, host_bucket.rate),
+            min(burst or host_bucket.burst, host_bucket.burst),
+        )
+        return RequestRateLimit(host_bucket, own_bucket)
+
+rate_limiters = RateLimiterRegistry.from_env()
@@ -0,0 +1,268 @@
+import asyncio
+import logging
+import os
+import tempfile
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from ..api.models import JobData, ScrapeRequest
+from .crawl_cursors import pending_cursors
+from .dedup import seen_key, seen_postings
+
+logger = logging.getLogger(__name__)
+
+class ScrapeResults:
+    """Serialized jobs of one scrape run, spilled to an NDJSON file past a size limit
+
+    Line byte offsets are kept for spilled results, so a page of results can
+    be read with a single seek however far into the file it starts.
+    """
+
+    def __init__(self, spill_dir: str, max_memory_jobs: int):
+        self.spill_dir = spill_dir
+        self.max_memory_jobs = max_memory_jobs
+        self.lines: List[str] = []
+        self.spill_path: Optional[str] = None
+        self.offsets: List[int] = []
+        self._spill_file = None
+
+    def __len__(self) -> int:
+        return len(self.offsets) if self.spill_path else len(self.lines)
+
+    @property
+    def spilled(self) -> bool:
+        return self.spill_path is not None
+
+    def append(self, job: JobData):
+        line = job.model_dump_json()
+        if self.spill_path is None and len(self.lines) < self.max_memory_jobs:
+            self.lines.append(line)
+            return
+
+        if self.spill_path is None:
+            self._spill()
+        self._write(line)
+
+    def _spill(self):
+        fd, self.spill_path = tempfile.mkstemp(prefix='scrape-', suffix='.ndjson', dir=self.spill_dir)
+        self._spill_file = os.fdopen(fd, 'w+b')
+        for line in self.lines:
+            self._write(line)
+        self.lines = []
+
+    def _write(self, line: str):
+        self.offsets.append(self._spill_file.tell())
+        self._spill_file.write(line.encode('utf-8') + b'\n')
+
+    def close(self):
+        """Flush spilled results once the run has finished writing"""
+        if self._spill_file is not None:
+            self._spill_file.flush()
+
+    def page(self, offset: int, limit: int) -> List[str]:
+        """Serialized jobs [offset, offset + limit)"""
+        if not self.spilled:
+            return self.lines[offset:offset + limit]
+
+        offsets = self.offsets[offset:offset + limit]
+        if not offsets:
+            return []
+        self._spill_file.flush()
+        with open(self.spill_path, 'rb') as f:
+            f.seek(offsets[0])
+            return [f.readline().decode('utf-8').rstrip('\n') for _ in offsets]
+
+    def delete(self):
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+        if self.spill_path and os.path.exists(self.spill_path):
+            os.remove(self.spill_path)
+        self.lines = []
+
+class ScrapeRun:
+    """One scrape submitted to the registry"""
+
+    def __init__(self, scraper_name: str, request: ScrapeRequest, results: ScrapeResults):
+        self.id = uuid.uuid4().hex
+        self.scraper_name = scraper_name
+        self.request = request
+        self.results = results
+        self.status = 'queued'
+        self.error: Optional[str] = None
+        self.created_at = datetime.now()
+        self.started_at: Optional[datetime] = None
+        self.completed_at: Optional[datetime] = None
+        self.finished_monotonic: Optional[float] = None
+        self.task: Optional[asyncio.Task] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ('completed', 'failed', 'timeout', 'cancelled')
+
+    def summary(self) -> Dict[str, Any]:
+        duration = None
+        if self.started_at:
+            duration = ((self.completed_at or datetime.now()) - self.started_at).total_seconds()
+        return {
+            "scrape_id": self.id,
+            "scraper_name": self.scraper_name,
+            "status": self.status,
+            "jobs_scraped": len(self.results),
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "completed_at": self.completed_at,
+            "duration": duration,
+            "results_spilled": self.results.spilled,
+        }
+
+class ScrapeRegistry:
+    """In-process registry of scrape runs and their results
+
+    Finished runs are evicted oldest first once there are more than max_runs
+    of them, or once they are older than results_ttl seconds. Running scrapes
+    are never evicted.
+    """
+
+    def __init__(self, max_runs: int = 100, results_ttl: float = 3600, max_memory_jobs: int = 1000,
+                 spill_dir: Optional[str] = None):
+        self.max_runs = max_runs
+        self.results_ttl = results_ttl
+        self.max_memory_jobs = max_memory_jobs
+        self.spill_dir = spill_dir or tempfile.gettempdir()
+        self.runs: 'OrderedDict[str, ScrapeRun]' = OrderedDict()
+
+    @classmethod
+    def from_env(cls) -> 'ScrapeRegistry':
+        return cls(
+            max_runs=int(os.getenv('SCRAPER_REGISTRY_MAX_RUNS', '100')),
+            results_ttl=float(os.getenv('SCRAPER_RESULTS_TTL', '3600')),
+            max_memory_jobs=int(os.getenv('SCRAPER_RESULTS_MEMORY_JOBS', '1000')),
+            spill_dir=os.getenv('SCRAPER_RESULTS_DIR'),
+        )
+
+    def submit(self, scraper_name: str, scraper, request: ScrapeRequest, timeout: Optional[float] = None,
+               semaphore: Optional[asyncio.Semaphore] = None) -> ScrapeRun:
+        """Register a run and start scraping in the background
+        
+        A run that exceeds `timeout` seconds ends with status 'timeout' and keeps
+        the jobs scraped so far. Runs sharing `semaphore` are capped in how many
+        scrape at once.
+        """
+        self.evict()
+        run = ScrapeRun(scraper_name, request, ScrapeResults(self.spill_dir, self.max_memory_jobs))
+        self.runs[run.id] = run
+        run.task = asyncio.create_task(self._run(run, scraper, timeout, semaphore))
+        return run
+
+    async def _run(self, run: ScrapeRun, scraper, timeout: Optional[float] = None,
+                   semaphore: Optional[asyncio.Semaphore] = None):
+        if semaphore is not None:
+            async with semaphore:
+                await self._scrape(run, scraper, timeout)
+        else:
+            await self._scrape(run, scraper, timeout)
+
+    async def _scrape(self, run: ScrapeRun, scraper, timeout: Optional[float] = None):
+        # The scrape id lets ack_seen scrapes stage their crawl cursors until the ack
+        config = {**run.request.job_board_config, 'scrape_id': run.id}
+        
+        async def collect():
+            async for job in scraper.iter_jobs(run.request.keywords, run.request.location,
+                                               run.request.max_pages, config):
+                run.results.append(job)
+
+        run.status = 'running'
+        run.started_at = datetime.now()
+        try:
+            await asyncio.wait_for(collect(), timeout)
+            run.status = 'completed'
+            logger.info(f"Scrape {run.id}: {run.scraper_name} scraped {len(run.results)} jobs")
+        except asyncio.TimeoutError:
+            logger.warning(f"Scrape {run.id}: {run.scraper_name} timed out after {timeout}s")
+            run.status = 'timeout'
+            run.error = f"Timed out after {timeout}s"
+        except asyncio.CancelledError:
+            run.status = 'cancelled'
+            raise
+        except Exception as e:
+            logger.error(f"Scrape {run.id}: error in {run.scraper_name} scraper: {str(e)}")
+            run.status = 'failed'
+            run.error = str(e)
+        finally:
+            run.results.close()
+            run.completed_at = datetime.now()
+            run.finished_monotonic = time.monotonic()
+
+    def get(self, scrape_id: str) -> Optional[ScrapeRun]:
+        return self.runs.get(scrape_id)
+
+    def evict(self):
+        now = time.monotonic()
+        finished = [run for run in self.runs.values() if run.finished]
+        finished.sort(key=lambda run: run.finished_monotonic)
+
+        excess = len(finished) - self.max_runs
+        for run in finished:
+            expired = now - run.finished_monotonic >= self.results_ttl
+            if excess <= 0 and not expired:
+                continue
+            self._remove(run)
+            excess -= 1
+
+    def _remove(self, run: ScrapeRun):
+        pending_cursors.discard(run.id)
+        run.results.delete()
+        self.runs.pop(run.id, None)
+
+    async def iter_results(self, run: ScrapeRun, batch_size: int = 500) -> AsyncIterator[str]:
+        """Yield serialized jobs, following a running scrape until it finishes"""
+        offset = 0
+        while True:
+            finished = run.finished
+            lines = run.results.page(offset, batch_size)
+            for line in lines:
+                yield line
+            offset += len(lines)
+            if not lines:
+                if finished:
+                    return
+                await asyncio.sleep(0.5)
+
+    async def ack(self, run: ScrapeRun, batch_size: int = 500) -> int:
+        """Mark a finished run's postings as seen and advance its crawl cursors,
+        once its client has stored them; returns how many postings"""
+        acked = 0
+        while True:
+            lines = run.results.page(acked, batch_size)
+            if not lines:
+                await pending_cursors.commit(run.id)
+                return acked
+            await seen_postings.add_many([seen_key(JobData.model_validate_json(line)) for line in lines])
+            acked += len(lines)
+
+    async def aclose(self):
+        for run in list(self.runs.values()):
+            if run.task is not None and not run.task.done():
+                run.task.cancel()
+                try:
+                    await run.task
+                except asyncio.CancelledError:
+                    pass
+            self._remove(run)
+
+    def stats(self) -> Dict[str, Any]:
+        statuses: Dict[str, int] = {}
+        for run in self.runs.values():
+            statuses[run.status] = statuses.get(run.status, 0) + 1
+        return {
+            'runs': len(self.runs),
+            'statuses': statuses,
+            'spilled_runs': sum(1 for run in self.runs.values() if run.results.spilled),
+        }
+
+scrape_registry = ScrapeRegistry.from_env()
@@ -1,50 +1,378 @@
 import httpx
 import asyncio
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union, AsyncIterator
 from datetime import datetime, timedelta
 import logging
+import os
+from contextlib import aclosing
 from bs4 import BeautifulSoup
 import json
 import re
 from urllib.parse import urljoin, urlparse
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # pragma: no cover - BeautifulSoup is used instead
+    LexborHTMLParser = None
+
 from ..api.models import JobData
+from .crawl_cursors import crawl_cursors, pending_cursors
+from .dedup import seen_key, seen_postings, stable_external_id
+from .http_cache import http_cache
+from .http_pool import http_pool
+from .parse_pool import parse_pool
+from .rate_limit import RequestRateLimit, rate_limiters
 
 logger = logging.getLogger(__name__)
 
+class HTMLParserBackend:
+    """Minimal CSS-selector interface the HTML scrapers use to read job cards"""
+    name = ''
+
+    def parse(self, html: Union[str, bytes]) -> Any:
+        raise NotImplementedError
+
+    def select(self, node: Any, selector: str) -> List[Any]:
+        raise NotImplementedError
+
+    def select_one(self, node: Any, selector: str) -> Optional[Any]:
+        raise NotImplementedError
+
+    def text(self, node: Any) -> str:
+        raise NotImplementedError
+
+    def attr(self, node: Any, name: str) -> Optional[str]:
+        raise NotImplementedError
+
+class SelectolaxBackend(HTMLParserBackend):
+    """Fast lexbor-based parser from selectolax"""
+    name = 'selectolax'
+
+    def parse(self, html: Union[str, bytes]) -> Any:
+        return LexborHTMLParser(html)
+
+    def select(self, node: Any, selector: str) -> List[Any]:
+        return node.css(selector)
+
+    def select_one(self, node: Any, selector: str) -> Optional[Any]:
+        return node.css_first(selector)
+
+    def text(self, node: Any) -> str:
+        # Collapse whitespace so both backends return identical strings
+        return ' '.join(node.text(separator=' ').split())
+
+    def attr(self, node: Any, name: str) -> Optional[str]:
+        return node.attributes.get(name)
+
+class BeautifulSoupBackend(HTMLParserBackend):
+    """BeautifulSoup fallback, used when selectolax is not installed"""
+    name = 'beautifulsoup'
+
+    def parse(self, html: Union[str, bytes]) -> Any:
+        return BeautifulSoup(html, 'lxml')
+
+    def select(self, node: Any, selector: str) -> List[Any]:
+        return node.select(selector)
+
+    def select_one(self, node: Any, selector: str) -> Optional[Any]:
+        return node.select_one(selector)
+
+    def text(self, node: Any) -> str:
+        return ' '.join(node.get_text(' ').split())
+
+    def attr(self, node: Any, name: str) -> Optional[str]:
+        return node.get(name)
+
+PARSER_BACKENDS = {
+    SelectolaxBackend.name: SelectolaxBackend,
+    BeautifulSoupBackend.name: BeautifulSoupBackend,
+}
+
+def get_parser_backend(name: Optional[str] = None) -> HTMLParserBackend:
+    """Return the named parser backend, defaulting to SCRAPER_HTML_PARSER (selectolax)"""
+    name = (name or os.getenv('SCRAPER_HTML_PARSER', SelectolaxBackend.name)).lower()
+    if name not in PARSER_BACKENDS:
+        raise ValueError(f"Unknown HTML parser backend '{name}'. Available: {list(PARSER_BACKENDS)}")
+    if name == SelectolaxBackend.name and LexborHTMLParser is None:
+        name = BeautifulSoupBackend.name
+    return PARSER_BACKENDS[name]()
+
+def extract_cards(html: Union[str, bytes], selectors: Dict[str, str], backend: HTMLParserBackend) -> List[Dict[str, str]]:
+    """Pull the text of each field selector out of every job card on a page
+
+    `selectors` maps 'card' to the card selector and every other field to a
+    selector relative to the card. The 'link' field returns the href.
+    """
+    cards = []
+    root = backend.parse(html)
+
+    for card in backend.select(root, selectors['card']):
+        fields = {}
+        for field, selector in selectors.items():
+            if field == 'card':
+                continue
+            node = backend.select_one(card, selector)
+            if node is None:
+                fields[field] = ''
+            elif field == 'link':
+                fields[field] = backend.attr(node, 'href') or ''
+            else:
+                fields[field] = backend.text(node)
+        cards.append(fields)
+
+    return cards
+
+INDEED_SELECTORS = {
+    'card': 'div.job_seen_beacon',
+    'title': 'h2.jobTitle',
+    'company': 'span.companyName',
+    'location': 'div.companyLocation',
+    'link': 'h2.jobTitle a',
+    'salary': 'span.salaryText',
+    'description': 'div.summary',
+}
+
+# LinkedIn has different selectors and may require authentication
+LINKEDIN_SELECTORS = {
+    'card': 'div.base-card',
+    'title': 'h3.base-search-card__title',
+    'company': 'a.hidden-nested-link',
+    'location': 'span.job-search-card__location',
+    'link': 'a.base-card__full-link',
+}
+
 class BaseScraper:
+    # Defaults for the per-host token bucket (unless SCRAPER_RATE_LIMITS sets the
+    # host's limit) and page fetch concurrency. A ScrapeRequest can override the
+    # concurrency through job_board_config, and can only lower the rate and burst
+    requests_per_second = 1.0
+    burst = 1
+    concurrency = 5
+    # Incremental crawl defaults, also overridable through job_board_config
+    incremental_concurrency = 1
+    known_page_threshold = 0.8
+    full_crawl_interval = 24  # hours
+
     def __init__(self, name: str, base_url: str):
         self.name = name
         self.base_url = base_url
-        self.session = None
+    
+    @property
+    def source(self) -> str:
+        return self.name.lower()
+    
+    @property
+    def session(self) -> httpx.AsyncClient:
+        """Shared keep-alive client for this source, borrowed from the process-wide pool"""
+        return http_pool.client(self.source)
     
     async def __aenter__(self):
-        self.session = httpx.AsyncClient(
-            timeout=30.0,
-            headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-        )
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.aclose()
+        # The pooled client outlives a single scrape; the app lifespan closes it
+        pass
+    
+    async def scrape_jobs(self, keywords: List[str], location: str = "", max_pages: int = 3,
+                          config: Optional[Dict[str, Any]] = None) -> List[JobData]:
+        """Collect every job from iter_jobs into a list"""
+        return [job async for job in self.iter_jobs(keywords, location, max_pages, config)]
     
-    async def scrape_jobs(self, keywords: List[str], location: str = "", max_pages: int = 3) -> List[JobData]:
-        """Main scraping method to be implemented by subclasses"""
+    def iter_jobs(self, keywords: List[str], location: str = "", max_pages: int = 3,
+                  config: Optional[Dict[str, Any]] = None) -> AsyncIterator[JobData]:
+        """Yield jobs as each page or API item is parsed; implemented by subclasses"""
         raise NotImplementedError
     
-    async def fetch_page(self, url: str) -> Optional[str]:
-        """Fetch a web page"""
+    def rate_limit(self, config: Optional[Dict[str, Any]] = None) -> RequestRateLimit:
+        """This scrape's rate limit: the host's shared bucket, slowed further if
+        job_board_config asks for a lower requests_per_second or burst"""
+        config = config or {}
+        host_bucket = rate_limiters.get(urlparse(self.base_url).netloc, self.requests_per_second, self.burst)
+        rate = config.get('requests_per_second')
+        burst = config.get('burst')
+        return rate_limiters.for_request(
+            host_bucket,
+            rate=float(rate) if rate is not None else None,
+            burst=int(burst) if burst is not None else None,
+        )
+    
+    async def iter_pages(self, urls: List[str], config: Optional[Dict[str, Any]] = None) -> AsyncIterator[Optional[bytes]]:
+        """Fetch pages concurrently, bounded by `concurrency` and the host's token bucket
+        
+        Pages are yielded in the same order as urls, as soon as each one is in.
+        At most `concurrency` fetches are in flight at a time, and pending
+        fetches are cancelled if the consumer stops early.
+        """
+        config = config or {}
+        limiter = self.rate_limit(config)
+        concurrency = max(1, int(config.get('concurrency', self.concurrency)))
+        pending = []
+        urls = iter(urls)
+        
+        try:
+            for url in urls:
+                pending.append(asyncio.create_task(self.fetch_page(url, limiter)))
+                if len(pending) >= concurrency:
+                    break
+            
+            while pending:
+                page = await pending.pop(0)
+                yield page
+                # Refill only once the consumer asks for more, so a consumer
+                # that stops early (incremental crawls) triggers no extra fetches
+                next_url = next(urls, None)
+                if next_url is not None:
+                    pending.append(asyncio.create_task(self.fetch_page(next_url, limiter)))
+        finally:
+            for task in pending:
+                task.cancel()
+    
+    async def get(self, url: str, limiter: Optional[RequestRateLimit] = None) -> bytes:
+        """GET url through the conditional-GET cache, if enabled
+        
+        Waits on `limiter`, or on the url host's shared bucket without one.
+        Returns NotModified (holding the cached body) when the server answers 304.
+        """
+        await (limiter or rate_limiters.get(urlparse(url).netloc)).acquire()
+        if http_cache is not None:
+            return await http_cache.get(self.session, url)
+        response = await self.session.get(url)
+        response.raise_for_status()
+        return response.content
+    
+    async def fetch_page(self, url: str, limiter: Optional[RequestRateLimit] = None) -> Optional[bytes]:
+        """Fetch a web page as raw bytes, ready to hand to a parse worker"""
         try:
-            response = await self.session.get(url)
-            response.raise_for_status()
-            return response.text
+            return await self.get(url, limiter)
         except Exception as e:
             logger.error(f"Error fetching {url}: {str(e)}")
             return None
     
+    def parse_page(self, page: bytes, parser: HTMLParserBackend) -> List[Dict[str, Any]]:
+        """Parse one listing page into JobData dicts; runs in a parse worker process"""
+        raise NotImplementedError
+    
+    async def parse_listing(self, page: bytes, config: Optional[Dict[str, Any]] = None) -> List[JobData]:
+        """Parse a fetched page in the parse pool, keeping the event loop free"""
+        try:
+            jobs = await parse_pool.run(parse_listing_page, self.source, page, (config or {}).get('parser'))
+        except Exception as e:
+            logger.error(f"{self.name}: error parsing page: {str(e)}")
+            return []
+        return [JobData(**job) for job in jobs]
+    
+    async def is_seen(self, jobs: List[JobData]) -> List[bool]:
+        """True for each posting an earlier scrape delivered unchanged; nothing is marked"""
+        return await seen_postings.contains_many([seen_key(job) for job in jobs])
+    
+    async def mark_seen(self, jobs: List[JobData], config: Optional[Dict[str, Any]] = None):
+        """Mark delivered postings as seen, for scrapes that skip seen postings
+        
+        With ack_seen the caller marks them instead, once it has stored them
+        (POST /scrape/{scrape_id}/ack), so nothing is lost if it fails first.
+        """
+        if jobs and self.skip_seen(config) and not (config or {}).get('ack_seen'):
+            await seen_postings.add_many([seen_key(job) for job in jobs])
+    
+    def skip_seen(self, config: Optional[Dict[str, Any]] = None) -> bool:
+        """Whether seen postings are dropped and delivered ones marked; pass skip_seen=True in job_board_config
+        
+        Off by default, so ad-hoc scrapes neither miss postings nor hide them from the backend's scrapes.
+        """
+        return bool((config or {}).get('skip_seen', False))
+    
+    def crawl_mode(self, cursor: Optional[Dict[str, Any]], config: Dict[str, Any]) -> str:
+        """'incremental' or 'full'; a query with no cursor, or whose last full crawl is
+        older than full_crawl_interval hours, is crawled in full to reconcile
+        
+        Only scrapes that skip seen postings crawl incrementally, so ad-hoc scrapes
+        always get every page and never move the backend's cursors.
+        """
+        mode = config.get('crawl_mode', 'incremental')
+        if mode != 'incremental' or not self.skip_seen(config):
+            return 'full'
+        if cursor is None:
+            return 'full'
+        interval = float(config.get('full_crawl_interval', self.full_crawl_interval))
+        last_full = datetime.fromisoformat(cursor['last_full_crawl'])
+        if interval and datetime.now() - last_full >= timedelta(hours=interval):
+            return 'full'
+        return 'incremental'
+    
+    async def iter_listing_jobs(self, urls: List[str], config: Optional[Dict[str, Any]] = None,
+                                cursor_key: Optional[str] = None) -> AsyncIterator[JobData]:
+        """Yield the unseen jobs on each listing page as soon as that page is parsed
+        
+        urls must list the newest postings first. In incremental mode paging
+        stops at the first page that contains the cursor posting (the newest
+        posting of the previous crawl), or whose share of known postings is at
+        least known_page_threshold, or that is empty. Pages are fetched
+        `incremental_concurrency` at a time so little is fetched past the stop.
+        """
+        config = config or {}
+        # Cursors belong to the scrapes that skip seen postings, like the seen-set
+        cursor_key = f"{self.source}:{cursor_key}" if cursor_key and self.skip_seen(config) else None
+        cursor = await crawl_cursors.get(cursor_key) if cursor_key else None
+        mode = self.crawl_mode(cursor, config)
+        threshold = float(config.get('known_page_threshold', self.known_page_threshold))
+        
+        fetch_config = config
+        if mode == 'incremental':
+            fetch_config = {**config, 'concurrency': config.get('incremental_concurrency', self.incremental_concurrency)}
+        
+        count = 0
+        pages_fetched = 0
+        newest_id = None
+        async with aclosing(self.iter_pages(urls, fetch_config)) as pages:
+            async for page in pages:
+                pages_fetched += 1
+                if not page:
+                    continue
+                # A 304 (NotModified) page is parsed from the cache like any other: the
+                # cache entry is stored at fetch time, but its postings only count as
+                # seen once delivered or acked, so the seen-set decides what to skip
+                jobs = await self.parse_listing(page, config)
+                if newest_id is None and jobs:
+                    newest_id = jobs[0].external_id
+                
+                seen = await self.is_seen(jobs)
+                # A posting is marked only once its yield returns, so jobs the consumer never took stay unseen
+                delivered = []
+                try:
+                    for job, was_seen in zip(jobs, seen):
+                        if not was_seen or not self.skip_seen(config):
+                            count += 1
+                            yield job
+                            delivered.append(job)
+                finally:
+                    await self.mark_seen(delivered, config)
+                
+                if mode != 'incremental':
+                    continue
+                known = sum(seen) / len(jobs) if jobs else 1.0
+                reached_cursor = any(job.external_id == cursor.get('external_id') for job in jobs)
+                if reached_cursor or known >= threshold:
+                    logger.info(
+                        f"{self.name}: incremental crawl stopped after page {pages_fetched} of {len(urls)} "
+                        f"({known:.0%} known{', reached cursor' if reached_cursor else ''})"
+                    )
+                    break
+        
+        await seen_postings.flush()
+        if cursor_key and newest_id:
+            now = datetime.now().isoformat()
+            new_cursor = {
+                'external_id': newest_id,
+                'updated_at': now,
+                'last_full_crawl': now if mode == 'full' else cursor['last_full_crawl'],
+            }
+            if not config.get('ack_seen'):
+                await crawl_cursors.set(cursor_key, new_cursor)
+            elif config.get('scrape_id'):
+                # Advanced by POST /scrape/{scrape_id}/ack once the results are stored
+                pending_cursors.stage(config['scrape_id'], cursor_key, new_cursor)
+        logger.info(f"{self.name}: Scraped {count} jobs ({mode} crawl, {pages_fetched} pages)")
+    
     def extract_salary(self, text: str) -> tuple[Optional[int], Optional[int]]:
         """Extract salary range from text"""
         if not text:
@@ -89,17 +417,20 @@ class RemoteOKScraper(BaseScraper):
     def __init__(self):
         super().__init__("RemoteOK", "https://remoteok.io")
     
-    async def scrape_jobs(self, keywords: List[str], location: str = "", max_pages: int = 3) -> List[JobData]:
-        jobs = []
+    async def iter_jobs(self, keywords: List[str], location: str = "", max_pages: int = 3,
+                        config: Optional[Dict[str, Any]] = None) -> AsyncIterator[JobData]:
+        count = 0
         
         async with self:
             # RemoteOK API endpoint
             api_url = f"{self.base_url}/api"
+            # Invalid rate limits in job_board_config fail the scrape instead of being logged
+            limiter = self.rate_limit(config)
             
             try:
-                response = await self.session.get(api_url)
-                response.raise_for_status()
-                data = response.json()
+                # A 304 returns the cached feed, filtered through the seen-set below
+                body = await self.get(api_url, limiter)
+                data = json.loads(body)
                 
                 # Skip the first item (it's metadata)
                 job_listings = data[1:] if len(data) > 1 else []
@@ -130,160 +461,134 @@ class RemoteOKScraper(BaseScraper):
                         posted_date=datetime.fromtimestamp(job_data.get('date', 0)) if job_data.get('date') else datetime.now()
                     )
                     
-                    jobs.append(job)
+                    if self.skip_seen(config) and (await self.is_seen([job]))[0]:
+                        continue
+                    
+                    count += 1
+                    yield job
+                    await self.mark_seen([job], config)
                     
                     # Limit results
-                    if len(jobs) >= max_pages * 25:  # Approximate pagination
+                    if count >= max_pages * 25:  # Approximate pagination
                         break
                 
-                logger.info(f"RemoteOK: Scraped {len(jobs)} jobs")
+                await seen_postings.flush()
+                logger.info(f"RemoteOK: Scraped {count} jobs")
                 
             except Exception as e:
                 logger.error(f"RemoteOK scraping error: {str(e)}")
-        
-        return jobs
 
 class IndeedScraper(BaseScraper):
+    requests_per_second = 1.0
+    burst = 2
+
     def __init__(self):
         super().__init__("Indeed", "https://indeed.com")
     
-    async def scrape_jobs(self, keywords: List[str], location: str = "", max_pages: int = 3) -> List[JobData]:
-        jobs = []
-        
+    async def iter_jobs(self, keywords: List[str], location: str = "", max_pages: int = 3,
+                        config: Optional[Dict[str, Any]] = None) -> AsyncIterator[JobData]:
         async with self:
             query = " ".join(keywords) if keywords else "developer"
+            search_urls = [
+                f"{self.base_url}/jobs?q={query}&l={location}&sort=date&start={page * 10}"
+                for page in range(max_pages)
+            ]
             
-            for page in range(max_pages):
-                start = page * 10
-                search_url = f"{self.base_url}/jobs?q={query}&l={location}&start={start}"
-                
-                html = await self.fetch_page(search_url)
-                if not html:
-                    continue
+            async for job in self.iter_listing_jobs(search_urls, config, f"{query}|{location}".lower()):
+                yield job
+    
+    def parse_page(self, page: bytes, parser: HTMLParserBackend) -> List[Dict[str, Any]]:
+        jobs = []
+        
+        for fields in extract_cards(page, INDEED_SELECTORS, parser):
+            try:
+                job_link = urljoin(self.base_url, fields['link']) if fields['link'] else ''
+                salary_min, salary_max = self.extract_salary(fields['salary'])
                 
-                soup = BeautifulSoup(html, 'html.parser')
-                job_cards = soup.find_all('div', class_='job_seen_beacon')
+                job = JobData(
+                    title=fields['title'],
+                    company=fields['company'],
+                    location=fields['location'],
+                    location_type='onsite',  # Indeed doesn't clearly specify
+                    job_type='full-time',
+                    description=fields['description'],
+                    requirements='',
+                    salary_min=salary_min,
+                    salary_max=salary_max,
+                    currency='USD',
+                    external_id=stable_external_id('indeed', job_link),
+                    external_url=job_link,
+                    tags=[],
+                    posted_date=datetime.now()
+                )
                 
-                for card in job_cards:
-                    try:
-                        # Extract job details
-                        title_elem = card.find('h2', class_='jobTitle')
-                        title = title_elem.get_text(strip=True) if title_elem else ''
-                        
-                        company_elem = card.find('span', class_='companyName')
-                        company = company_elem.get_text(strip=True) if company_elem else ''
-                        
-                        location_elem = card.find('div', class_='companyLocation')
-                        job_location = location_elem.get_text(strip=True) if location_elem else ''
-                        
-                        # Get job link
-                        link_elem = title_elem.find('a') if title_elem else None
-                        job_link = urljoin(self.base_url, link_elem.get('href')) if link_elem else ''
-                        
-                        # Extract salary if available
-                        salary_elem = card.find('span', class_='salaryText')
-                        salary_text = salary_elem.get_text(strip=True) if salary_elem else ''
-                        salary_min, salary_max = self.extract_salary(salary_text)
-                        
-                        # Get job description snippet
-                        desc_elem = card.find('div', class_='summary')
-                        description = desc_elem.get_text(strip=True) if desc_elem else ''
-                        
-                        job = JobData(
-                            title=title,
-                            company=company,
-                            location=job_location,
-                            location_type='onsite',  # Indeed doesn't clearly specify
-                            job_type='full-time',
-                            description=description,
-                            requirements='',
-                            salary_min=salary_min,
-                            salary_max=salary_max,
-                            currency='USD',
-                            external_id=f"indeed_{hash(job_link)}",
-                            external_url=job_link,
-                            tags=[],
-                            posted_date=datetime.now()
-                        )
-                        
-                        jobs.append(job)
-                        
-                    except Exception as e:
-                        logger.error(f"Error parsing Indeed job card: {str(e)}")
-                        continue
+                jobs.append(job.model_dump())
                 
-                # Add delay between requests
-                await asyncio.sleep(1)
+            except Exception as e:
+                logger.error(f"Error parsing Indeed job card: {str(e)}")
+                continue
         
-        logger.info(f"Indeed: Scraped {len(jobs)} jobs")
         return jobs
 
 class LinkedInScraper(BaseScraper):
+    requests_per_second = 0.5
+    burst = 1
+
     def __init__(self):
         super().__init__("LinkedIn", "https://linkedin.com")
     
-    async def scrape_jobs(self, keywords: List[str], location: str = "", max_pages: int = 3) -> List[JobData]:
-        jobs = []
-        
+    async def iter_jobs(self, keywords: List[str], location: str = "", max_pages: int = 3,
+                        config: Optional[Dict[str, Any]] = None) -> AsyncIterator[JobData]:
         async with self:
             # LinkedIn requires more sophisticated handling
             # This is a simplified version
             query = " ".join(keywords) if keywords else "developer"
+            search_urls = [
+                f"{self.base_url}/jobs/search?keywords={query}&location={location}&sortBy=DD&start={page * 25}"
+                for page in range(max_pages)
+            ]
             
-            for page in range(max_pages):
-                start = page * 25
-                search_url = f"{self.base_url}/jobs/search?keywords={query}&location={location}&start={start}"
-                
-                html = await self.fetch_page(search_url)
-                if not html:
-                    continue
-                
-                soup = BeautifulSoup(html, 'html.parser')
+            async for job in self.iter_listing_jobs(search_urls, config, f"{query}|{location}".lower()):
+                yield job
+    
+    def parse_page(self, page: bytes, parser: HTMLParserBackend) -> List[Dict[str, Any]]:
+        jobs = []
+        
+        for fields in extract_cards(page, LINKEDIN_SELECTORS, parser):
+            try:
+                job_link = fields['link']
                 
-                # LinkedIn has different selectors and may require authentication
-                # This is a placeholder implementation
-                job_cards = soup.find_all('div', class_='base-card')
+                job = JobData(
+                    title=fields['title'],
+                    company=fields['company'],
+                    location=fields['location'],
+                    location_type='onsite',
+                    job_type='full-time',
+                    description='',
+                    requirements='',
+                    salary_min=None,
+                    salary_max=None,
+                    currency='USD',
+                    external_id=stable_external_id('linkedin', job_link),
+                    external_url=job_link,
+                    tags=[],
+                    posted_date=datetime.now()
+                )
                 
-                for card in job_cards:
-                    try:
-                        title_elem = card.find('h3', class_='base-search-card__title')
-                        title = title_elem.get_text(strip=True) if title_elem else ''
-                        
-                        company_elem = card.find('a', class_='hidden-nested-link')
-                        company = company_elem.get_text(strip=True) if company_elem else ''
-                        
-                        location_elem = card.find('span', class_='job-search-card__location')
-                        job_location = location_elem.get_text(strip=True) if location_elem else ''
-                        
-                        # Get job link
-                        link_elem = card.find('a', class_='base-card__full-link')
-                        job_link = link_elem.get('href') if link_elem else ''
-                        
-                        job = JobData(
-                            title=title,
-                            company=company,
-                            location=job_location,
-                            location_type='onsite',
-                            job_type='full-time',
-                            description='',
-                            requirements='',
-                            salary_min=None,
-                            salary_max=None,
-                            currency='USD',
-                            external_id=f"linkedin_{hash(job_link)}",
-                            external_url=job_link,
-                            tags=[],
-                            posted_date=datetime.now()
-                        )
-                        
-                        jobs.append(job)
-                        
-                    except Exception as e:
-                        logger.error(f"Error parsing LinkedIn job card: {str(e)}")
-                        continue
+                jobs.append(job.model_dump())
                 
-                # Add delay between requests
-                await asyncio.sleep(2)
+            except Exception as e:
+                logger.error(f"Error parsing LinkedIn job card: {str(e)}")
+                continue
         
-        logger.info(f"LinkedIn: Scraped {len(jobs)} jobs")
-        return jobs
\ No newline at end of file
+        return jobs
+
+# Scrapers whose listing pages are parsed in the parse pool, keyed by source
+PAGE_PARSERS = {
+    'indeed': IndeedScraper,
+    'linkedin': LinkedInScraper,
+}
+
+def parse_listing_page(source: str, page: bytes, parser_name: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Parse-pool entry point: turn one fetched page into JobData dicts"""
+    return PAGE_PARSERS[source]().parse_page(page, get_parser_backend(parser_name))
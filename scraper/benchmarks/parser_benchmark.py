@@ -0,0 +1,69 @@
+"""Micro-benchmark for the HTML parser backends
+
+Parses the saved Indeed and LinkedIn search pages in benchmarks/fixtures with
+every backend in PARSER_BACKENDS and reports cards/sec per backend. Parity
+between the backends is covered by tests/test_parser_parity.py.
+
+Run from the scraper directory:
+
+    python -m benchmarks.parser_benchmark --iterations 500
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from app.services.scraper import (
+    INDEED_SELECTORS,
+    LINKEDIN_SELECTORS,
+    PARSER_BACKENDS,
+    extract_cards,
+)
+
+FIXTURES_DIR = Path(__file__).parent / 'fixtures'
+FIXTURES = {
+    'indeed': ('indeed_search.html', INDEED_SELECTORS),
+    'linkedin': ('linkedin_search.html', LINKEDIN_SELECTORS),
+}
+
+def load_fixtures():
+    return {
+        name: ((FIXTURES_DIR / filename).read_text(encoding='utf-8'), selectors)
+        for name, (filename, selectors) in FIXTURES.items()
+    }
+
+def benchmark(fixtures, backend, iterations):
+    cards = 0
+    started = time.perf_counter()
+    for _ in range(iterations):
+        for html, selectors in fixtures.values():
+            cards += len(extract_cards(html, selectors, backend))
+    elapsed = time.perf_counter() - started
+    return {
+        'cards': cards,
+        'seconds': elapsed,
+        'cards_per_second': cards / elapsed if elapsed else None,
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--iterations', type=int, default=200,
+                        help='Times each fixture page is parsed per backend')
+    parser.add_argument('--json', action='store_true', help='Print the results as JSON')
+    args = parser.parse_args(argv)
+
+    fixtures = load_fixtures()
+    backends = [backend_class() for backend_class in PARSER_BACKENDS.values()]
+
+    results = {backend.name: benchmark(fixtures, backend, args.iterations) for backend in backends}
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for name, stats in results.items():
+            print(f"{name}: {stats['cards_per_second']:,.0f} cards/sec ({stats['cards']} cards in {stats['seconds']:.2f}s)")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
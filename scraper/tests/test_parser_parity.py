@@ -0,0 +1,38 @@
+"""Parity between the HTML parser backends on the saved search pages in benchmarks/fixtures"""
+import pytest
+
+from app.services.scraper import PARSER_BACKENDS, extract_cards, parse_listing_page
+from benchmarks.parser_benchmark import load_fixtures
+
+FIXTURES = load_fixtures()
+BACKEND_NAMES = list(PARSER_BACKENDS)
+
+@pytest.mark.parametrize('source', list(FIXTURES))
+def test_backends_extract_the_same_cards(source):
+    html, selectors = FIXTURES[source]
+    results = {name: extract_cards(html, selectors, PARSER_BACKENDS[name]()) for name in BACKEND_NAMES}
+    reference_name, reference = BACKEND_NAMES[0], results[BACKEND_NAMES[0]]
+
+    assert reference, f"{reference_name} found no {source} cards"
+    for name, cards in results.items():
+        assert len(cards) == len(reference), f"{name} found {len(cards)} cards, {reference_name} {len(reference)}"
+        for position, (card, expected) in enumerate(zip(cards, reference)):
+            assert card == expected, f"{source} card {position} differs between {name} and {reference_name}"
+
+@pytest.mark.parametrize('source', list(FIXTURES))
+def test_backends_build_the_same_jobs(source):
+    html, _ = FIXTURES[source]
+    # posted_date is stamped with the parse time, so it is left out
+    results = {
+        name: [
+            {field: value for field, value in job.items() if field != 'posted_date'}
+            for job in parse_listing_page(source, html.encode('utf-8'), name)
+        ]
+        for name in BACKEND_NAMES
+    }
+    reference = results[BACKEND_NAMES[0]]
+
+    assert reference
+    assert all(job['title'] and job['external_id'] for job in reference)
+    for name, jobs in results.items():
+        assert jobs == reference, f"{name} and {BACKEND_NAMES[0]} built different {source} jobs"